@@ -37,7 +37,9 @@ class AdminAuth(AuthenticationBackend):
             result = await session.execute(stmt)
             user = result.scalar_one_or_none()
 
-            if (not user) or (not user.is_admin) or (not HashingMixin.verify_password(password, user.hashed_password)):
+            if (not user) or (not user.is_admin):
+                return False
+            if not await HashingMixin.verify_password_async(password, user.hashed_password):
                 return False
 
         request.session.update({'user_id': user.id})
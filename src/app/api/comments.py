@@ -42,6 +42,7 @@ async def get_comments_by_task(
     member: Annotated[User, Depends(require_member)],
     l: int = 0,
     o: int = 0,
+    c: int | None = None,
 ) -> list[CommentSchema]:
     """
     Retrieve all comments for a specific task.
@@ -51,11 +52,12 @@ async def get_comments_by_task(
         task_id (int): ID of the task to fetch comments for.
         team_id (int): ID of the team the task belongs to.
         member (User): Authenticated user performing the request.
+        c (int | None): ID of the last comment of the previous page, for keyset pagination.
 
     Returns:
         list[CommentSchema]: List of comments associated with the task.
     """
-    return await service.get_comments_by_task(task_id, team_id, l, o)
+    return await service.get_comments_by_task(task_id, team_id, l, o, c)
 
 
 @comments_router.delete('/{comment_id:int}', status_code=status.HTTP_204_NO_CONTENT)
@@ -45,6 +45,7 @@ async def get_meetings_by_team(
     member: Annotated[User, Depends(require_member)],
     l: int = 0,
     o: int = 0,
+    c: int | None = None,
 ) -> list[MeetingSchema]:
     """
     Retrieve all meetings for a specific team.
@@ -53,11 +54,12 @@ async def get_meetings_by_team(
         service (MeetingService): Dependency providing meeting operations.
         team_id (int): ID of the team.
         member (User): Authenticated user performing the request.
+        c (int | None): ID of the last meeting of the previous page, for keyset pagination.
 
     Returns:
         list[MeetingSchema]: List of meetings for the team.
     """
-    return await service.get_meetings_by_team(team_id, l, o)
+    return await service.get_meetings_by_team(team_id, l, o, c)
 
 
 @meetings_router.get('/mine')
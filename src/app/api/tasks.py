@@ -48,6 +48,7 @@ async def get_tasks_by_team(
     member: Annotated[User, Depends(require_member)],
     l: int = 0,
     o: int = 0,
+    c: int | None = None,
 ) -> list[TaskSchema]:
     """
     Retrieve all tasks for a specific team.
@@ -56,11 +57,12 @@ async def get_tasks_by_team(
         service (TaskService): Task service dependency.
         team_id (int): ID of the team.
         member (User): Authenticated user performing the request.
+        c (int | None): ID of the last task of the previous page, for keyset pagination.
 
     Returns:
         list[TaskSchema]: List of tasks for the team.
     """
-    return await service.get_tasks_by_team(team_id, l, o)
+    return await service.get_tasks_by_team(team_id, l, o, c)
 
 
 @tasks_router.get('/mine')
@@ -70,6 +72,7 @@ async def get_my_tasks_in_team(
     member: Annotated[User, Depends(require_member)],
     l: int = 0,
     o: int = 0,
+    c: int | None = None,
 ) -> list[TaskSchema]:
     """
     Retrieve tasks assigned to the current user within a team.
@@ -78,11 +81,12 @@ async def get_my_tasks_in_team(
         service (TaskService): Task service dependency.
         team_id (int): ID of the team.
         member (User): Authenticated user.
+        c (int | None): ID of the last task of the previous page, for keyset pagination.
 
     Returns:
         list[TaskSchema]: List of tasks assigned to the user.
     """
-    return await service.get_tasks_by_performer(member.id, team_id, l, o)
+    return await service.get_tasks_by_performer(member.id, team_id, l, o, c)
 
 
 @tasks_router.put('/{task_id:int}')
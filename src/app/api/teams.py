@@ -121,7 +121,7 @@ async def remove_team_member(
         team_id (int): ID of the team.
         admin (User): Admin performing the removal.
     """
-    await service.remove_user_from_team(user_id, team_id)
+    await service.remove_user_from_team(user_id, team_id, admin.id)
 
 
 @teams_router.get('/{team_id:int}/avg-evaluation')
@@ -35,6 +35,17 @@ class Config(BaseSettings):
         DB_NAME (str): Database name.
         DB_USER (str): Database username.
         DB_PASS (str): Database password.
+        DB_NULL_POOL (bool): Open a fresh connection per checkout instead of pooling. Use it
+            when an external pooler such as PgBouncer already multiplexes connections.
+        DB_POOL_SIZE (int): Number of persistent connections kept in the pool.
+        DB_MAX_OVERFLOW (int): Extra connections allowed above the pool size under load.
+        DB_POOL_RECYCLE (int): Seconds after which a pooled connection is replaced.
+        DB_POOL_TIMEOUT (int): Seconds to wait for a free pooled connection before giving up.
+        DB_STATEMENT_CACHE_SIZE (int): Size of the asyncpg prepared statement caches.
+            Set to 0 when connecting through PgBouncer in transaction pooling mode.
+        DB_QUERY_CACHE_SIZE (int): Size of SQLAlchemy's compiled statement cache.
+        DB_JIT (bool): Allow PostgreSQL to JIT-compile queries. It is switched off per connection
+            by default, since the app only runs short OLTP queries that never repay the compile time.
         ADMIN_NAME (str): Admin username.
         ADMIN_PASS (str): Admin password.
     """
@@ -54,6 +65,15 @@ class Config(BaseSettings):
     DB_USER: str = Field(alias='DB_USER')
     DB_PASS: str = Field(alias='DB_PASS')
 
+    DB_NULL_POOL: bool = False
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 30 * 60
+    DB_POOL_TIMEOUT: int = 5
+    DB_STATEMENT_CACHE_SIZE: int = 1024
+    DB_QUERY_CACHE_SIZE: int = 1500
+    DB_JIT: bool = False
+
     ADMIN_NAME: str = Field(alias='ADMIN_NAME')
     ADMIN_PASS: str = Field(alias='ADMIN_PASS')
 
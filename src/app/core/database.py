@@ -5,33 +5,85 @@ This module provides the asynchronous engine, session factory, and helper
 functions to manage the database schema. It also includes a dependency
 for FastAPI to provide sessions to endpoints.
 
+Context variables:
+    session_ctx: Session opened by a middleware and shared with the rest of the request.
+
 Functions:
     get_session() -> AsyncGenerator[AsyncSession, None]: Async generator yielding a database session.
     init_models() -> None: Initializes all database tables.
     drop_models() -> None: Drops all database tables.
+    warm_pool() -> None: Opens the pool's persistent connections ahead of the first requests.
+    pool_timeout_handler(request, exc) -> JSONResponse: Turns pool exhaustion into a 503 response.
 """
 
+import asyncio
+from contextvars import ContextVar
 from typing import AsyncGenerator
 
+from fastapi import Request, status
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 
 from app.core.config import config
 from app.models import Base
 
-engine = create_async_engine(url=config.DB_URL)
+if config.DB_NULL_POOL:
+    pool_options = {'poolclass': NullPool}
+else:
+    pool_options = {
+        'pool_size': config.DB_POOL_SIZE,
+        'max_overflow': config.DB_MAX_OVERFLOW,
+        'pool_pre_ping': True,
+        'pool_recycle': config.DB_POOL_RECYCLE,
+        'pool_timeout': config.DB_POOL_TIMEOUT,
+    }
+
+connect_args = {
+    'statement_cache_size': config.DB_STATEMENT_CACHE_SIZE,
+    'prepared_statement_cache_size': config.DB_STATEMENT_CACHE_SIZE,
+}
+if not config.DB_JIT:
+    connect_args['server_settings'] = {'jit': 'off'}
+
+engine = create_async_engine(
+    url=config.DB_URL,
+    **pool_options,
+    query_cache_size=config.DB_QUERY_CACHE_SIZE,
+    connect_args=connect_args,
+)
 
-session_factory = async_sessionmaker(engine, expire_on_commit=False)
+session_factory = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+session_ctx: ContextVar[AsyncSession | None] = ContextVar('session', default=None)
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """
     Async generator that yields a database session.
 
+    Reuses the session stored in `session_ctx` when a middleware has already
+    opened one for the current request, so the request checks out a single connection.
+
+    A new session owns the request's transaction: it is committed once when the
+    request finishes and rolled back if the request fails.
+
     Yields:
         AsyncSession: A SQLAlchemy asynchronous session.
     """
+    shared_session = session_ctx.get()
+    if shared_session is not None:
+        yield shared_session
+        return
+
     async with session_factory() as session:
-        yield session
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
 
 
 async def init_models() -> None:
@@ -52,3 +104,34 @@ async def drop_models() -> None:
     """
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+
+
+async def warm_pool() -> None:
+    """
+    Opens `DB_POOL_SIZE` connections at once and returns them to the pool.
+
+    This way the first requests after startup do not pay the connection setup cost.
+    Does nothing when pooling is disabled.
+    """
+    if config.DB_NULL_POOL:
+        return
+
+    connections = await asyncio.gather(*(engine.connect().start() for _ in range(config.DB_POOL_SIZE)))
+    await asyncio.gather(*(connection.close() for connection in connections))
+
+
+async def pool_timeout_handler(request: Request, exc: PoolTimeoutError) -> JSONResponse:
+    """
+    Exception handler for requests that could not get a database connection in time.
+
+    Args:
+        request (Request): The incoming request.
+        exc (PoolTimeoutError): Error raised by the connection pool.
+
+    Returns:
+        JSONResponse: 503 response asking the client to retry later.
+    """
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={'detail': 'Database is busy, please try again later'},
+    )
@@ -2,8 +2,9 @@
 Application lifespan management.
 
 This module defines an async context manager for FastAPI's lifespan event.
-It ensures that database tables are initialized and the admin user is created
-before the application starts serving requests.
+It ensures that database tables are initialized, the admin user is created, the
+connection pool is filled and the frontend templates and OpenAPI schema are
+compiled before the application starts serving requests.
 
 Functions:
     lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -16,6 +17,8 @@ from typing import AsyncGenerator
 from fastapi import FastAPI
 
 from app.admin.setup import create_admin_if_not_exists
+from app.core.database import warm_pool
+from app.front.render import warm_templates
 
 
 @asynccontextmanager
@@ -23,7 +26,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
     FastAPI lifespan context manager.
 
-    Initializes the admin user if it does not exist
+    Initializes the admin user if it does not exist, warms the connection pool,
+    the template cache and the OpenAPI schema.
 
     Args:
         app (FastAPI): The FastAPI application instance.
@@ -32,5 +36,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         None
     """
     await create_admin_if_not_exists()
+    await warm_pool()
+    warm_templates()
+    app.openapi()
 
     yield
@@ -16,14 +16,17 @@ Mixins:
     TokenMixin: Provides JWT token creation, validation, and payload extraction.
 """
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Annotated
 
 import jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from passlib.context import CryptContext
-from passlib.exc import UnknownHashError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -35,13 +38,10 @@ from app.models.users import User
 
 http_bearer = HTTPBearer()
 
-pwd_context = CryptContext(
-    schemes=['argon2'],
-    deprecated='auto',
-    argon2__time_cost=2,
-    argon2__memory_cost=102400,
-    argon2__parallelism=4,
-)
+password_hasher = PasswordHasher(time_cost=2, memory_cost=102400, parallelism=4)
+
+# Each Argon2 call allocates ~100 MiB, so concurrent hashes are capped at one per core.
+hashing_executor = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix='password-hashing')
 
 
 async def get_request_user(
@@ -121,11 +121,11 @@ async def require_member(
     Returns:
         User: The authenticated user.
     """
-    stmt = select(UserTeam).where(UserTeam.user_id == user.id, UserTeam.team_id == team_id)
+    stmt = select(UserTeam.role).where(UserTeam.user_id == user.id, UserTeam.team_id == team_id)
     result = await session.execute(stmt)
-    association = result.scalar_one_or_none()
+    role = result.scalar_one_or_none()
 
-    if not association:
+    if role is None:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail='You are not a member of this team')
 
     return user
@@ -145,11 +145,11 @@ async def require_admin(
     Returns:
         User: The authenticated user.
     """
-    stmt = select(UserTeam).where(UserTeam.user_id == user.id, UserTeam.team_id == team_id)
+    stmt = select(UserTeam.role).where(UserTeam.user_id == user.id, UserTeam.team_id == team_id)
     result = await session.execute(stmt)
-    association = result.scalar_one_or_none()
+    role = result.scalar_one_or_none()
 
-    if not association or association.role != UserRoles.ADMIN:
+    if role != UserRoles.ADMIN:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail='Admin access required')
 
     return user
@@ -169,11 +169,11 @@ async def require_manager(
     Returns:
         User: The authenticated user.
     """
-    stmt = select(UserTeam).where(UserTeam.user_id == user.id, UserTeam.team_id == team_id)
+    stmt = select(UserTeam.role).where(UserTeam.user_id == user.id, UserTeam.team_id == team_id)
     result = await session.execute(stmt)
-    association = result.scalar_one_or_none()
+    role = result.scalar_one_or_none()
 
-    if not association or association.role not in {UserRoles.MANAGER, UserRoles.ADMIN}:
+    if role not in {UserRoles.MANAGER, UserRoles.ADMIN}:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail='Manager or admin access required')
 
     return user
@@ -187,16 +187,28 @@ class HashingMixin:
     @staticmethod
     def hash_password(password: str) -> str:
         """Hash a plaintext password."""
-        return pwd_context.hash(password)
+        return password_hasher.hash(password)
 
     @staticmethod
     def verify_password(password: str, hashed_password: str) -> bool:
         """Verify a plaintext password against a hashed password."""
         try:
-            return pwd_context.verify(password, hashed_password)
-        except UnknownHashError:
+            return password_hasher.verify(hashed_password, password)
+        except (VerificationError, InvalidHashError):
             return False
 
+    @classmethod
+    async def hash_password_async(cls, password: str) -> str:
+        """Hash a plaintext password in the hashing thread pool, keeping the event loop free."""
+        return await asyncio.get_running_loop().run_in_executor(hashing_executor, cls.hash_password, password)
+
+    @classmethod
+    async def verify_password_async(cls, password: str, hashed_password: str) -> bool:
+        """Verify a plaintext password in the hashing thread pool, keeping the event loop free."""
+        return await asyncio.get_running_loop().run_in_executor(
+            hashing_executor, cls.verify_password, password, hashed_password
+        )
+
 
 class TokenMixin:
     """
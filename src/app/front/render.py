@@ -0,0 +1,57 @@
+from fastapi import Request
+from fastapi.responses import HTMLResponse
+from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
+from app.core.config import config
+
+from .utils import FrontContext
+
+env = Environment(
+    loader=FileSystemLoader('app/front/templates', followlinks=False),
+    autoescape=select_autoescape(['html']),
+    auto_reload=config.DEBUG,
+    cache_size=400,
+    bytecode_cache=FileSystemBytecodeCache(),
+)
+templates = Jinja2Templates(env=env)
+
+
+def render(name: str, request: Request, context: FrontContext) -> HTMLResponse:
+    """
+    Render a frontend template with the standard `request` and `context` variables.
+    """
+    return templates.TemplateResponse(name, {'request': request, 'context': context})
+
+
+static_pages_cache: dict[tuple[str, str], bytes] = {}
+
+
+def render_static_page(name: str, request: Request, context: FrontContext) -> HTMLResponse:
+    """
+    Render a page whose output depends only on the authenticated user.
+
+    For anonymous visitors the output only varies with the base URL the templates
+    build links from, so it is rendered once per template and base URL and served
+    from `static_pages_cache` afterwards.
+    """
+    if context.is_auth:
+        return render(name, request, context)
+
+    key = (name, str(request.base_url))
+    body = static_pages_cache.get(key)
+    if body is None:
+        body = env.get_template(name).render(request=request, context=context).encode()
+        static_pages_cache[key] = body
+    return HTMLResponse(content=body)
+
+
+def warm_templates() -> None:
+    """
+    Compile every frontend template into the environment cache.
+
+    Called once at startup so the first request to each page does not pay
+    for parsing and compiling the template.
+    """
+    for name in env.list_templates(extensions=['html']):
+        env.get_template(name)
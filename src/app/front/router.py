@@ -1,13 +1,11 @@
 from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_session
-from app.core.security import require_manager, require_member
 from app.schemas.tasks import TaskStatuses
 from app.schemas.teams import UserRoles
 from app.services.calendar import CalendarService, get_calendar_service
@@ -16,11 +14,10 @@ from app.services.meetings import MeetingService, get_meeting_service
 from app.services.tasks import TaskService, get_task_service
 from app.services.teams import TeamService, get_team_service
 
-from .utils import get_context, get_meeting_by_id, get_task_by_id, get_team_role
+from .render import render, render_static_page
+from .utils import FrontContextDep, get_meeting_by_id, get_role_or_403, get_task_by_id
 
-templates = Jinja2Templates(directory='app/front/templates')
-
-front_router = APIRouter(dependencies=[Depends(get_context)])
+front_router = APIRouter()
 
 
 convert_roles = {
@@ -39,59 +36,58 @@ convert_statuses = {
 @front_router.get('/', response_class=HTMLResponse)
 async def home_page(
     request: Request,
+    context: FrontContextDep,
     team_service: Annotated[TeamService, Depends(get_team_service)],
 ):
-    context = request.state.context
     teams = []
-    user = context.get('user')
+    user = context.user
     if user:
         teams = await team_service.get_teams_by_user(user.id)
         for team in teams:
             team.role = convert_roles[team.role]
-        context['teams'] = teams
+        context.teams = teams
 
-    return templates.TemplateResponse('home.html', {'request': request, 'context': context})
+    return render('home.html', request, context)
 
 
 @front_router.get('/teams/{team_id:int}', response_class=HTMLResponse)
 async def team_page(
     team_id: int,
     request: Request,
+    context: FrontContextDep,
     session: Annotated[AsyncSession, Depends(get_session)],
     task_service: Annotated[TaskService, Depends(get_task_service)],
     team_service: Annotated[TeamService, Depends(get_team_service)],
-    calendar_service: Annotated[CalendarService, Depends(get_calendar_service)],
     meeting_service: Annotated[MeetingService, Depends(get_meeting_service)],
 ):
-    context = request.state.context
-    context['team_id'] = team_id
-    user = context.get('user')
+    context.team_id = team_id
+    user = context.user
     if user:
         try:
-            await require_member(team_id, user, session)
-
-            role = await get_team_role(session, user.id, team_id)
-            context['role'] = convert_roles[role]
+            role = await get_role_or_403(session, user.id, team_id)
+            context.role = convert_roles[role]
 
             tasks = await task_service.get_tasks_by_team(team_id)
+            evaluations = []
             for task in tasks:
                 task.status = convert_statuses[task.status]
-            context['tasks'] = tasks
-
-            users = await team_service.get_users(team_id)
-            for user in users:
-                user.role = convert_roles[user.role]
-            context['users'] = users
+                if task.performer_id == user.id and task.evaluation is not None:
+                    evaluations.append(task.evaluation)
+            context.tasks = tasks
+            context.evaluation = round(sum(evaluations) / len(evaluations), 2) if evaluations else 0.0
 
-            context['evaluation'] = await team_service.get_avg_evaluation(user.user_id, team_id)
+            members = await team_service.get_users(team_id)
+            for member in members:
+                member.role = convert_roles[member.role]
+            context.users = members
 
             meetings = await meeting_service.get_meetings_by_team(team_id)
-            context['meetings'] = meetings
+            context.meetings = meetings
 
         except Exception:
-            context['error'] = True
+            context.error = True
 
-    return templates.TemplateResponse('team.html', {'request': request, 'context': context})
+    return render('team.html', request, context)
 
 
 @front_router.get('/teams/{team_id:int}/tasks/{task_id:int}', response_class=HTMLResponse)
@@ -99,31 +95,29 @@ async def task_page(
     team_id: int,
     task_id: int,
     request: Request,
+    context: FrontContextDep,
     session: Annotated[AsyncSession, Depends(get_session)],
     comment_service: Annotated[CommentService, Depends(get_comment_service)],
 ):
-    context = request.state.context
-    context['team_id'] = team_id
-    context['task_id'] = task_id
-    user = context.get('user')
+    context.team_id = team_id
+    context.task_id = task_id
+    user = context.user
     if user:
         try:
-            await require_member(team_id, user, session)
-
-            role = await get_team_role(session, user.id, team_id)
-            context['role'] = convert_roles[role]
+            role = await get_role_or_403(session, user.id, team_id)
+            context.role = convert_roles[role]
 
             task = await get_task_by_id(session, task_id)
             task.status = convert_statuses[task.status]
-            context['task'] = task
+            context.task = task
 
             comments = await comment_service.get_comments_by_task(task_id, team_id)
-            context['comments'] = comments
+            context.comments = comments
 
         except Exception:
-            context['error'] = True
+            context.error = True
 
-    return templates.TemplateResponse('task.html', {'request': request, 'context': context})
+    return render('task.html', request, context)
 
 
 @front_router.get('/teams/{team_id:int}/meetings/{meeting_id:int}', response_class=HTMLResponse)
@@ -131,73 +125,69 @@ async def meeting_page(
     team_id: int,
     meeting_id: int,
     request: Request,
+    context: FrontContextDep,
     session: Annotated[AsyncSession, Depends(get_session)],
     team_service: Annotated[TeamService, Depends(get_team_service)],
 ):
-    context = request.state.context
-    context['team_id'] = team_id
-    context['meeting_id'] = meeting_id
-    user = context.get('user')
+    context.team_id = team_id
+    context.meeting_id = meeting_id
+    user = context.user
     if user:
         try:
-            await require_manager(team_id, user, session)
-
-            role = await get_team_role(session, user.id, team_id)
-            context['role'] = convert_roles[role]
+            role = await get_role_or_403(session, user.id, team_id)
+            if role not in {UserRoles.MANAGER, UserRoles.ADMIN}:
+                raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail='Manager or admin access required')
+            context.role = convert_roles[role]
 
             meeting = await get_meeting_by_id(session, meeting_id)
-            context['meeting'] = meeting
+            context.meeting = meeting
 
-            users = await team_service.get_users(team_id)
-            for user in users:
-                user.role = convert_roles[user.role]
-            context['users'] = users
+            members = await team_service.get_users(team_id)
+            for member in members:
+                member.role = convert_roles[member.role]
+            context.users = members
 
         except Exception:
-            context['error'] = True
+            context.error = True
 
-    return templates.TemplateResponse('meeting.html', {'request': request, 'context': context})
+    return render('meeting.html', request, context)
 
 
 @front_router.get('/teams/{team_id:int}/calendar', response_class=HTMLResponse)
 async def calendar_page(
     team_id: int,
     request: Request,
+    context: FrontContextDep,
     session: Annotated[AsyncSession, Depends(get_session)],
     calendar_service: Annotated[CalendarService, Depends(get_calendar_service)],
 ):
-    context = request.state.context
-    context['team_id'] = team_id
-    user = context.get('user')
+    context.team_id = team_id
+    user = context.user
     if user:
         try:
-            await require_member(team_id, user, session)
-
-            role = await get_team_role(session, user.id, team_id)
-            context['role'] = convert_roles[role]
+            role = await get_role_or_403(session, user.id, team_id)
+            context.role = convert_roles[role]
 
             now = datetime.now()
-            context['calendar_day'] = await calendar_service.get_calendar_by_date(team_id, now.date())
-            context['calendar_month'] = await calendar_service.get_calendar_by_month(team_id, now.year, now.month)
+            context.calendar_day, context.calendar_month = await calendar_service.get_calendar_by_date_and_month(
+                team_id, now.date()
+            )
         except Exception:
-            context['error'] = True
+            context.error = True
 
-    return templates.TemplateResponse('calendar.html', {'request': request, 'context': context})
+    return render('calendar.html', request, context)
 
 
 @front_router.get('/register', response_class=HTMLResponse)
-async def register_page(request: Request):
-    context = request.state.context
-    return templates.TemplateResponse('register.html', {'request': request, 'context': context})
+async def register_page(request: Request, context: FrontContextDep):
+    return render_static_page('register.html', request, context)
 
 
 @front_router.get('/login', response_class=HTMLResponse)
-async def login_page(request: Request):
-    context = request.state.context
-    return templates.TemplateResponse('login.html', {'request': request, 'context': context})
+async def login_page(request: Request, context: FrontContextDep):
+    return render_static_page('login.html', request, context)
 
 
 @front_router.get('/profile', response_class=HTMLResponse)
-async def profile_page(request: Request):
-    context = request.state.context
-    return templates.TemplateResponse('profile.html', {'request': request, 'context': context})
+async def profile_page(request: Request, context: FrontContextDep):
+    return render_static_page('profile.html', request, context)
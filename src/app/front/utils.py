@@ -1,73 +1,154 @@
+from dataclasses import dataclass
 from typing import Annotated
 
-from fastapi import Depends, HTTPException, Request
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import HTTPBearer
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.responses import Response
 
-from app.core.database import get_session
+from app.core.database import session_ctx, session_factory
 from app.core.security import get_request_user
+from app.models.evaluations import Evaluation
 from app.models.meetings import Meeting
 from app.models.tasks import Task
 from app.models.teams import UserTeam
+from app.models.users import User
+from app.schemas.calendar import CalendarDateSchema, CalendarMonthSchema
+from app.schemas.comments import CommentSchema
 from app.schemas.meetings import MeetingSchema
 from app.schemas.tasks import TaskSchema
-from app.schemas.teams import UserRoles
+from app.schemas.teams import TeamByMemberSchema, TeamMemberSchema, UserRoles
+
+NON_FRONT_PREFIXES = ('/api', '/admin', '/static')
 
 http_bearer = HTTPBearer(auto_error=False)
 
 
-async def get_context(
-    request: Request,
-    session: Annotated[AsyncSession, Depends(get_session)],
-    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(http_bearer)] = None,
-) -> dict:
-    context = {
-        'is_auth': False,
-        'user': None,
-        'error': False,
-    }
+@dataclass(slots=True)
+class FrontContext:
+    """
+    Template context shared by all frontend pages.
+
+    Pages fill in only the fields they render; everything else keeps its default.
+    """
+
+    is_auth: bool = False
+    user: User | None = None
+    error: bool = False
+    role: str | None = None
+    team_id: int | None = None
+    task_id: int | None = None
+    meeting_id: int | None = None
+    teams: list[TeamByMemberSchema] | None = None
+    users: list[TeamMemberSchema] | None = None
+    tasks: list[TaskSchema] | None = None
+    task: TaskSchema | None = None
+    comments: list[CommentSchema] | None = None
+    meetings: list[MeetingSchema] | None = None
+    meeting: MeetingSchema | None = None
+    evaluation: float | None = None
+    calendar_day: CalendarDateSchema | None = None
+    calendar_month: CalendarMonthSchema | None = None
+
+
+async def get_context(request: Request) -> FrontContext:
+    """
+    Dependency returning the context prepared by `FrontContextMiddleware`.
+    """
+    return request.state.context
+
+
+FrontContextDep = Annotated[FrontContext, Depends(get_context)]
+
+
+class FrontContextMiddleware(BaseHTTPMiddleware):
+    """
+    Builds the template context for frontend pages and stores it in `request.state.context`.
+
+    The user is only resolved when a Bearer token or the `access_token` cookie is present,
+    so anonymous requests never acquire a database session or hit Redis. The session
+    opened for an authenticated request is published through `session_ctx` and reused
+    by the page dependencies. API, admin and static requests are passed through untouched.
+    """
 
-    try:
-        user = await get_request_user(request, session, credentials)
-    except HTTPException:
-        user = None
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        if request.url.path.startswith(NON_FRONT_PREFIXES):
+            return await call_next(request)
 
-    if user:
-        context['is_auth'] = True
-        context['user'] = user
+        context = FrontContext()
 
-    request.state.context = context
-    return context
+        credentials = await http_bearer(request)
+        if credentials is None and 'access_token' not in request.cookies:
+            request.state.context = context
+            return await call_next(request)
 
+        async with session_factory() as session:
+            try:
+                user = await get_request_user(request, session, credentials)
+            except HTTPException:
+                user = None
 
-async def get_team_role(
+            if user:
+                context.is_auth = True
+                context.user = user
+
+            request.state.context = context
+            token = session_ctx.set(session)
+            try:
+                return await call_next(request)
+            finally:
+                session_ctx.reset(token)
+
+
+async def get_role_or_403(
     session: AsyncSession,
     user_id: int,
     team_id: int,
 ) -> UserRoles:
-    stmt = select(UserTeam).where(UserTeam.user_id == user_id, UserTeam.team_id == team_id)
+    stmt = select(UserTeam.role).where(UserTeam.user_id == user_id, UserTeam.team_id == team_id)
     result = await session.execute(stmt)
-    association = result.scalar_one_or_none()
-    return association.role
+    role = result.scalar_one_or_none()
+
+    if role is None:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail='You are not a member of this team')
+
+    return role
 
 
 async def get_task_by_id(
     session: AsyncSession,
     task_id: int,
 ) -> TaskSchema:
-    stmt = select(Task).where(Task.id == task_id).options(selectinload(Task.evaluation))
+    stmt = (
+        select(
+            Task.id,
+            Task.created_at,
+            Task.updated_at,
+            Task.description,
+            Task.deadline,
+            Task.status,
+            Task.performer_id,
+            Task.team_id,
+            Evaluation.value.label('evaluation'),
+        )
+        .outerjoin(Evaluation, Evaluation.task_id == Task.id)
+        .where(Task.id == task_id)
+    )
     result = await session.execute(stmt)
-    task = result.scalar_one_or_none()
-    return TaskSchema.model_validate(task)
+    row = result.one_or_none()
+
+    if row is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Task not found')
+
+    return TaskSchema.model_validate(row._mapping)
 
 
 async def get_meeting_by_id(
     session: AsyncSession,
     meeting_id: int,
-) -> TaskSchema:
-    stmt = select(Meeting).where(Meeting.id == meeting_id)
-    result = await session.execute(stmt)
-    meeting = result.scalar_one_or_none()
+) -> MeetingSchema:
+    meeting = await session.get(Meeting, meeting_id, options=[selectinload(Meeting.users)])
     return MeetingSchema.model_validate(meeting)
@@ -12,12 +12,15 @@ Functions:
 from fastapi import FastAPI
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 
 from app.admin.setup import init_admin
 from app.api.root import get_root_router
 from app.core.config import config
+from app.core.database import pool_timeout_handler
 from app.core.lifespan import lifespan
 from app.front.router import front_router
+from app.front.utils import FrontContextMiddleware
 
 
 def create_app(skip_static: bool = False) -> FastAPI:
@@ -29,9 +32,11 @@ def create_app(skip_static: bool = False) -> FastAPI:
         - Default response class as JSONResponse.
         - Lifespan management for startup/shutdown events.
         - Debug mode as defined in the configuration.
+        - 503 responses when the database connection pool is exhausted.
         - Admin interface initialization.
         - Root router inclusion.
         - Frontend routed inclusion.
+        - Frontend context middleware.
         - Mount static files (skipped if skip_static=True).
 
     Args:
@@ -50,12 +55,15 @@ def create_app(skip_static: bool = False) -> FastAPI:
         debug=config.DEBUG,
     )
 
+    app.add_exception_handler(PoolTimeoutError, pool_timeout_handler)
+
     init_admin(app)
 
     root_router = get_root_router()
     app.include_router(root_router)
 
     app.include_router(front_router)
+    app.add_middleware(FrontContextMiddleware)
 
     if not skip_static:
         app.mount('/static', StaticFiles(directory='app/front/static'), name='static')
@@ -1,15 +1,20 @@
+from collections.abc import AsyncIterator
 from typing import Annotated
 
 from fastapi import Depends
-from sqlalchemy import select
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import Row, Select, bindparam, delete, exists, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from app.core.database import get_session
 from app.models.comments import Comment
 from app.models.tasks import Task
 from app.schemas.comments import CommentCreateSchema
 
+COMMENTS_BATCH_SIZE = 200
+
+TASK_TEAM_ID_STMT = select(Task.team_id).where(Task.id == bindparam('task_id'))
+
 
 class CommentManager:
     """
@@ -27,6 +32,7 @@ class CommentManager:
             session (AsyncSession): SQLAlchemy async session for database operations.
         """
         self.session = session
+        self._task_team_ok: set[tuple[int, int]] = set()
 
     async def __check_task_in_team(self, task_id: int, team_id: int):
         """
@@ -40,16 +46,20 @@ class CommentManager:
             LookupError: If the task does not exist.
             PermissionError: If the task belongs to another team.
         """
-        stmt = select(Task).where(Task.id == task_id)
-        result = await self.session.execute(stmt)
-        task = result.scalar_one_or_none()
+        if (task_id, team_id) in self._task_team_ok:
+            return
+
+        result = await self.session.execute(TASK_TEAM_ID_STMT, {'task_id': task_id})
+        task_team_id = result.scalar_one_or_none()
 
-        if not task:
+        if task_team_id is None:
             raise LookupError('Task not found')
 
-        if task.team_id != team_id:
+        if task_team_id != team_id:
             raise PermissionError('Task does not belong to the given team')
 
+        self._task_team_ok.add((task_id, team_id))
+
     async def create_comment(
         self, comment_data: CommentCreateSchema, user_id: int, task_id: int, team_id: int
     ) -> Comment:
@@ -68,53 +78,137 @@ class CommentManager:
         Raises:
             LookupError: If the task does not exist.
             PermissionError: If the task belongs to another team.
-            SQLAlchemyError: If an error occurs during database commit.
+            SQLAlchemyError: If the database statement fails.
         """
         await self.__check_task_in_team(task_id, team_id)
 
-        new_comment = Comment(
-            text=comment_data.text,
-            user_id=user_id,
-            task_id=task_id,
+        stmt = (
+            insert(Comment)
+            .values(
+                text=comment_data.text,
+                user_id=user_id,
+                task_id=task_id,
+            )
+            .returning(Comment)
         )
-        self.session.add(new_comment)
 
-        try:
-            await self.session.commit()
-            await self.session.refresh(new_comment)
-        except SQLAlchemyError:
-            await self.session.rollback()
-            raise
+        new_comment = await self.session.scalar(stmt)
 
         return new_comment
 
-    async def get_comments_by_task(self, task_id: int, team_id: int, limit: int = 0, offset: int = 0) -> list[Comment]:
+    async def create_comments(
+        self, comments_data: list[CommentCreateSchema], user_id: int, task_id: int, team_id: int
+    ) -> list[Comment]:
         """
-        Retrieve comments for a given task.
+        Create several comments for a task with a single bulk INSERT.
 
         Args:
-            task_id (int): ID of the task.
+            comments_data (list[CommentCreateSchema]): Data for creating the comments.
+            user_id (int): ID of the user creating the comments.
+            task_id (int): ID of the related task.
             team_id (int): ID of the team the task belongs to.
-            limit (int, optional): Maximum number of comments to return. Defaults to 0 (no limit).
-            offset (int, optional): Number of comments to skip for pagination. Defaults to 0.
 
         Returns:
-            list[Comment]: A list of comments ordered by creation date.
+            list[Comment]: The created comment instances, in the given order.
 
         Raises:
             LookupError: If the task does not exist.
             PermissionError: If the task belongs to another team.
+            SQLAlchemyError: If the database statement fails.
         """
         await self.__check_task_in_team(task_id, team_id)
 
-        stmt = select(Comment).where(Comment.task_id == task_id).order_by(Comment.created_at)
+        if not comments_data:
+            return []
+
+        rows = [{'text': comment_data.text, 'user_id': user_id, 'task_id': task_id} for comment_data in comments_data]
+
+        result = await self.session.scalars(insert(Comment).returning(Comment, sort_by_parameter_order=True), rows)
+        new_comments = result.all()
+
+        return new_comments
+
+    def __comments_stmt(self, entities: tuple, task_id: int, limit: int, offset: int, cursor: int | None) -> Select:
+        """
+        Build the statement listing comments of a task.
+
+        Args:
+            entities (tuple): Entities or columns to select.
+            task_id (int): ID of the task.
+            limit (int): Maximum number of comments to return, 0 for no limit.
+            offset (int): Number of comments to skip.
+            cursor (int | None): Return only comments with a greater ID.
+
+        Returns:
+            Select: Statement ordered by comment ID.
+        """
+        stmt = select(*entities).where(Comment.task_id == task_id).order_by(Comment.id)
+        if cursor is not None:
+            stmt = stmt.where(Comment.id > cursor)
         if limit:
             stmt = stmt.limit(limit)
         if offset:
             stmt = stmt.offset(offset)
+        return stmt
+
+    async def get_comments_by_task(
+        self, task_id: int, team_id: int, limit: int = 0, offset: int = 0, cursor: int | None = None
+    ) -> list[Comment]:
+        """
+        Retrieve comments for a given task.
+
+        Args:
+            task_id (int): ID of the task.
+            team_id (int): ID of the team the task belongs to.
+            limit (int, optional): Maximum number of comments to return. Defaults to 0 (no limit).
+            offset (int, optional): Number of comments to skip for pagination. Defaults to 0.
+            cursor (int | None, optional): Return only comments created after the comment with this ID.
+                Cheaper than `offset` for deep pages. Defaults to None.
+
+        Returns:
+            list[Comment]: A list of comments ordered by creation.
+
+        Raises:
+            LookupError: If the task does not exist.
+            PermissionError: If the task belongs to another team.
+        """
+        await self.__check_task_in_team(task_id, team_id)
+
+        stmt = self.__comments_stmt((Comment,), task_id, limit, offset, cursor).options(raiseload('*'))
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
+    async def iter_comments_by_task(
+        self, task_id: int, team_id: int, limit: int = 0, offset: int = 0, cursor: int | None = None
+    ) -> AsyncIterator[Row]:
+        """
+        Stream comments for a given task as plain rows, in batches.
+
+        Rows skip ORM hydration and the identity map, which makes them the cheaper
+        choice for read-only listings.
+
+        Args:
+            task_id (int): ID of the task.
+            team_id (int): ID of the team the task belongs to.
+            limit (int, optional): Maximum number of comments to return. Defaults to 0 (no limit).
+            offset (int, optional): Number of comments to skip for pagination. Defaults to 0.
+            cursor (int | None, optional): Return only comments created after the comment with this ID.
+                Defaults to None.
+
+        Yields:
+            Row: Comment rows ordered by creation.
+
+        Raises:
+            LookupError: If the task does not exist.
+            PermissionError: If the task belongs to another team.
+        """
+        await self.__check_task_in_team(task_id, team_id)
+
+        stmt = self.__comments_stmt(tuple(Comment.__table__.c), task_id, limit, offset, cursor)
+        result = await self.session.stream(stmt.execution_options(yield_per=COMMENTS_BATCH_SIZE))
+        async for row in result:
+            yield row
+
     async def delete_comment(self, comment_id: int, task_id: int, team_id: int) -> bool:
         """
         Delete a comment by its ID.
@@ -130,28 +224,29 @@ class CommentManager:
         Raises:
             LookupError: If the task does not exist.
             PermissionError: If the task belongs to another team.
-            SQLAlchemyError: If an error occurs during database commit.
+            SQLAlchemyError: If the database statement fails.
         """
-        await self.__check_task_in_team(task_id, team_id)
+        stmt = (
+            delete(Comment)
+            .where(
+                Comment.id == comment_id,
+                Comment.task_id == task_id,
+                exists().where(Task.id == Comment.task_id, Task.team_id == team_id),
+            )
+            .returning(Comment.id)
+        )
 
-        stmt = select(Comment).where(Comment.id == comment_id)
         result = await self.session.execute(stmt)
-        comment = result.scalar_one_or_none()
+        deleted_id = result.scalar_one_or_none()
 
-        if not comment or comment.task_id != task_id:
+        if deleted_id is None:
+            await self.__check_task_in_team(task_id, team_id)
             return False
 
-        await self.session.delete(comment)
-        try:
-            await self.session.commit()
-        except SQLAlchemyError:
-            await self.session.rollback()
-            raise
-
         return True
 
 
-def get_comment_manager(session: Annotated[AsyncSession, Depends(get_session)]) -> CommentManager:
+async def get_comment_manager(session: Annotated[AsyncSession, Depends(get_session)]) -> CommentManager:
     """
     Dependency provider for CommentManager.
 
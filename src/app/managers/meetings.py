@@ -1,18 +1,22 @@
-from datetime import date, datetime, time, timezone
+from datetime import UTC, date, datetime, time
 from typing import Annotated
 
 from fastapi import Depends
-from sqlalchemy import select
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import bindparam, delete, func, insert, literal, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.core.database import get_session
-from app.models.meetings import Meeting
+from app.models.meetings import Meeting, user_meeting_association
 from app.models.teams import UserTeam
-from app.models.users import User
 from app.schemas.meetings import MeetingCreateSchema, MeetingUpdateSchema
 
+MEETING_BY_ID_STMT = select(Meeting).where(Meeting.id == bindparam('meeting_id')).options(raiseload('*'))
+
+MEETING_WITH_USERS_BY_ID_STMT = MEETING_BY_ID_STMT.options(selectinload(Meeting.users))
+
 
 class MeetingManager:
     """
@@ -55,48 +59,28 @@ class MeetingManager:
         Raises:
             ValueError: If the combined datetime is in the past.
         """
-        meeting_datetime = datetime.combine(meeting_date, meeting_time, tzinfo=timezone.utc)
-        if meeting_datetime < datetime.now(timezone.utc):
+        now = datetime.now(UTC)
+        if (meeting_date, meeting_time.replace(tzinfo=None)) < (now.date(), now.time()):
             raise ValueError('Meeting date and time cannot be in the past')
 
-    async def __check_is_meeting_exists(
-        self, meeting_data: MeetingCreateSchema | MeetingUpdateSchema, team_id: int
-    ) -> None:
-        """
-        Check whether a meeting already exists for a given date, time, and team.
-
-        Args:
-            meeting_data (MeetingCreateSchema | MeetingUpdateSchema): Meeting data.
-            team_id (int): ID of the team.
-
-        Raises:
-            ValueError: If a meeting already exists at the given date and time.
-        """
-        stmt = select(Meeting).where(
-            Meeting.team_id == team_id,
-            Meeting.date == meeting_data.date,
-            Meeting.time == meeting_data.time,
-        )
-        result = await self.session.execute(stmt)
-        existing_meeting = result.scalar_one_or_none()
-
-        if existing_meeting:
-            raise ValueError('A meeting already exists at the given date and time')
-
-    async def __check_meeting_in_team(self, meeting_id: int, team_id: int) -> None:
+    async def __get_meeting_in_team(self, meeting_id: int, team_id: int, *, load_users: bool = False) -> Meeting:
         """
-        Ensure that a meeting exists and belongs to the given team.
+        Load a meeting, ensuring that it exists and belongs to the given team.
 
         Args:
             meeting_id (int): ID of the meeting.
             team_id (int): ID of the team.
+            load_users (bool, optional): Whether to load the participants as well. Defaults to False.
+
+        Returns:
+            Meeting: The meeting, with its participants loaded if requested.
 
         Raises:
             LookupError: If the meeting is not found.
             PermissionError: If the meeting belongs to another team.
         """
-        stmt = select(Meeting).where(Meeting.id == meeting_id)
-        result = await self.session.execute(stmt)
+        stmt = MEETING_WITH_USERS_BY_ID_STMT if load_users else MEETING_BY_ID_STMT
+        result = await self.session.execute(stmt, {'meeting_id': meeting_id})
         meeting = result.scalar_one_or_none()
 
         if not meeting:
@@ -105,24 +89,59 @@ class MeetingManager:
         if meeting.team_id != team_id:
             raise PermissionError('Meeting does not belong to the given team')
 
-    async def __check_user_in_team(self, user_id: int, team_id: int) -> None:
+        return meeting
+
+    async def __check_team_members(self, member_ids: list[int], team_id: int) -> set[int]:
         """
-        Ensure that a user belongs to the given team.
+        Ensure that every given user belongs to the team without loading the users.
 
         Args:
-            user_id (int): ID of the user.
+            member_ids (list[int]): IDs of the users.
             team_id (int): ID of the team.
 
+        Returns:
+            set[int]: The distinct member IDs.
+
         Raises:
-            LookupError: If the user is not found in the team.
+            LookupError: If any of the users is not found in the team.
         """
-        stmt = select(UserTeam).where(UserTeam.user_id == user_id, UserTeam.team_id == team_id)
+        ids = set(member_ids)
+        stmt = select(UserTeam.user_id).where(UserTeam.team_id == team_id, UserTeam.user_id.in_(ids))
         result = await self.session.execute(stmt)
-        user = result.scalar_one_or_none()
 
-        if not user:
+        if ids - set(result.scalars().all()):
             raise LookupError('User not found in this team')
 
+        return ids
+
+    async def __sync_meeting_members(self, meeting: Meeting, member_ids: set[int]) -> None:
+        """
+        Bring the participants of a meeting in line with the given IDs.
+
+        Only the association rows that actually change are deleted or inserted.
+
+        Args:
+            meeting (Meeting): Meeting with its participants loaded.
+            member_ids (set[int]): IDs of the users that should take part.
+        """
+        current_ids = {user.id for user in meeting.users}
+
+        to_remove = current_ids - member_ids
+        if to_remove:
+            await self.session.execute(
+                delete(user_meeting_association).where(
+                    user_meeting_association.c.meeting_id == meeting.id,
+                    user_meeting_association.c.user_id.in_(to_remove),
+                )
+            )
+
+        to_add = member_ids - current_ids
+        if to_add:
+            await self.session.execute(
+                insert(user_meeting_association),
+                [{'meeting_id': meeting.id, 'user_id': user_id} for user_id in to_add],
+            )
+
     async def create_meeting(self, meeting_data: MeetingCreateSchema | MeetingUpdateSchema, team_id: int) -> Meeting:
         """
         Create a new meeting for a team.
@@ -132,45 +151,58 @@ class MeetingManager:
             team_id (int): ID of the team.
 
         Returns:
-            Meeting: The created meeting instance.
+            Meeting: The created meeting instance, with its participants loaded.
 
         Raises:
             ValueError: If `member_ids` is empty, if a meeting already exists at
                         the given date and time, or if the date/time are in the past.
             LookupError: If a specified user is not in the team.
-            SQLAlchemyError: If a database error occurs during commit.
+            SQLAlchemyError: If a database error occurs during flush.
         """
         self.__check_ids_is_not_empty(meeting_data.member_ids)
         self.__check_meeting_datetime(meeting_data.date, meeting_data.time)
-        await self.__check_is_meeting_exists(meeting_data, team_id)
+        member_ids = set(meeting_data.member_ids)
 
-        new_meeting = Meeting(
-            name=meeting_data.name,
-            date=meeting_data.date,
-            time=meeting_data.time,
-            team_id=team_id,
+        stmt = (
+            pg_insert(Meeting)
+            .values(
+                name=meeting_data.name,
+                date=meeting_data.date,
+                time=meeting_data.time,
+                team_id=team_id,
+            )
+            .on_conflict_do_nothing(index_elements=['team_id', 'date', 'time'])
+            .returning(Meeting)
         )
 
-        for member_id in meeting_data.member_ids:
-            await self.__check_user_in_team(member_id, team_id)
-
-        stmt = select(User).where(User.id.in_(meeting_data.member_ids))
-        result = await self.session.execute(stmt)
-        users = result.scalars().all()
-        new_meeting.users.extend(users)
-
-        self.session.add(new_meeting)
-
-        try:
-            await self.session.commit()
-            await self.session.refresh(new_meeting)
-        except SQLAlchemyError:
-            await self.session.rollback()
-            raise
+        # A savepoint discards the meeting when a member is rejected, leaving the caller's transaction intact.
+        async with self.session.begin_nested():
+            new_meeting = await self.session.scalar(stmt)
+            if new_meeting is None:
+                raise ValueError('A meeting already exists at the given date and time')
+
+            members_stmt = (
+                insert(user_meeting_association)
+                .from_select(
+                    ['meeting_id', 'user_id'],
+                    select(literal(new_meeting.id), UserTeam.user_id).where(
+                        UserTeam.team_id == team_id, UserTeam.user_id.in_(member_ids)
+                    ),
+                )
+                .returning(user_meeting_association.c.user_id)
+            )
+            result = await self.session.execute(members_stmt)
+            if member_ids - set(result.scalars().all()):
+                raise LookupError('User not found in this team')
+
+            await self.session.flush()
+            await self.session.refresh(new_meeting, attribute_names=['users'])
 
         return new_meeting
 
-    async def get_meetings_by_team(self, team_id: int, limit: int = 0, offset: int = 0) -> list[Meeting]:
+    async def get_meetings_by_team(
+        self, team_id: int, limit: int = 0, offset: int = 0, cursor: int | None = None
+    ) -> list[Meeting]:
         """
         Retrieve all meetings for a given team.
 
@@ -178,11 +210,20 @@ class MeetingManager:
             team_id (int): ID of the team.
             limit (int, optional): Maximum number of meetings to return. Defaults to 0 (no limit).
             offset (int, optional): Number of meetings to skip. Defaults to 0.
+            cursor (int | None, optional): Return only meetings created after the meeting with this ID.
+                Cheaper than `offset` for deep pages. Defaults to None.
 
         Returns:
-            list[Meeting]: List of meetings with participants preloaded.
+            list[Meeting]: List of meetings with participants preloaded, ordered by creation.
         """
-        stmt = select(Meeting).where(Meeting.team_id == team_id).options(selectinload(Meeting.users))
+        stmt = (
+            select(Meeting)
+            .where(Meeting.team_id == team_id)
+            .options(selectinload(Meeting.users), raiseload('*'))
+            .order_by(Meeting.id)
+        )
+        if cursor is not None:
+            stmt = stmt.where(Meeting.id > cursor)
         if limit:
             stmt = stmt.limit(limit)
         if offset:
@@ -207,9 +248,13 @@ class MeetingManager:
         """
         stmt = (
             select(Meeting)
-            .join(Meeting.users)
-            .where(User.id == member_id, Meeting.team_id == team_id)
-            .options(selectinload(Meeting.users))
+            .where(
+                Meeting.team_id == team_id,
+                Meeting.id.in_(
+                    select(user_meeting_association.c.meeting_id).where(user_meeting_association.c.user_id == member_id)
+                ),
+            )
+            .options(selectinload(Meeting.users), raiseload('*'))
         )
         if limit:
             stmt = stmt.limit(limit)
@@ -218,7 +263,61 @@ class MeetingManager:
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
-    async def update_meeting(self, meeting_data: MeetingUpdateSchema, meeting_id: int, team_id: int) -> Meeting | None:
+    async def __update_meeting_columns(
+        self, meeting_data: MeetingUpdateSchema, values: dict, meeting_id: int, team_id: int
+    ) -> Meeting:
+        """
+        Update scalar columns of a meeting with a single UPDATE ... RETURNING.
+
+        Ownership and the "not in the past" rule are part of the WHERE clause, so
+        the meeting is only loaded again when the statement matches nothing.
+
+        Args:
+            meeting_data (MeetingUpdateSchema): Data to update the meeting.
+            values (dict): Column values to set.
+            meeting_id (int): ID of the meeting.
+            team_id (int): ID of the team.
+
+        Returns:
+            Meeting: The updated meeting instance.
+
+        Raises:
+            ValueError: If a meeting already exists at the given date and time,
+                        or if the resulting date/time are in the past.
+            LookupError: If the meeting is not found.
+            PermissionError: If the meeting belongs to another team.
+            SQLAlchemyError: If a database error occurs during flush.
+        """
+        meeting_date = Meeting.date if meeting_data.date is None else literal(meeting_data.date)
+        meeting_time = Meeting.time if meeting_data.time is None else literal(meeting_data.time)
+        stmt = (
+            update(Meeting)
+            .where(
+                Meeting.id == meeting_id,
+                Meeting.team_id == team_id,
+                meeting_date + meeting_time >= func.timezone('UTC', func.now()),
+            )
+            .values(**values)
+            .returning(Meeting)
+            .execution_options(populate_existing=True, synchronize_session=False)
+        )
+
+        try:
+            async with self.session.begin_nested():
+                meeting = await self.session.scalar(stmt)
+        except IntegrityError:
+            raise ValueError('A meeting already exists at the given date and time') from None
+
+        if meeting is None:
+            # The meeting exists in this team, so the datetime guard is what rejected the row. The
+            # database clock decides that, so report it even when the local clock disagrees.
+            meeting = await self.__get_meeting_in_team(meeting_id, team_id)
+            self.__check_meeting_datetime(meeting_data.date or meeting.date, meeting_data.time or meeting.time)
+            raise ValueError('Meeting date and time cannot be in the past')
+
+        return meeting
+
+    async def update_meeting(self, meeting_data: MeetingUpdateSchema, meeting_id: int, team_id: int) -> Meeting:
         """
         Update details of an existing meeting.
 
@@ -228,48 +327,42 @@ class MeetingManager:
             team_id (int): ID of the team.
 
         Returns:
-            Meeting | None: The updated meeting instance, or None if not found.
+            Meeting: The updated meeting instance.
 
         Raises:
             ValueError: If `member_ids` is empty, if a meeting already exists at
                         the given date and time, or if the date/time are in the past.
             LookupError: If the meeting or a user is not found.
             PermissionError: If the meeting belongs to another team.
-            SQLAlchemyError: If a database error occurs during commit.
+            SQLAlchemyError: If a database error occurs during flush.
         """
-        await self.__check_meeting_in_team(meeting_id, team_id)
-        await self.__check_is_meeting_exists(meeting_data, team_id)
-
-        stmt = select(Meeting).where(Meeting.id == meeting_id)
-        result = await self.session.execute(stmt)
-        meeting = result.scalar_one_or_none()
-
-        if not meeting:
-            return None
+        values = meeting_data.model_dump(exclude_unset=True, exclude_none=True, exclude={'member_ids'})
+        if meeting_data.member_ids is None and values:
+            return await self.__update_meeting_columns(meeting_data, values, meeting_id, team_id)
 
+        meeting = await self.__get_meeting_in_team(meeting_id, team_id, load_users=meeting_data.member_ids is not None)
         self.__check_meeting_datetime(meeting_data.date or meeting.date, meeting_data.time or meeting.time)
 
-        if meeting_data.name is not None:
-            meeting.name = meeting_data.name
-        if meeting_data.date is not None:
-            meeting.date = meeting_data.date
-        if meeting_data.time is not None:
-            meeting.time = meeting_data.time
+        member_ids = None
         if meeting_data.member_ids is not None:
             self.__check_ids_is_not_empty(meeting_data.member_ids)
-            for member_id in meeting_data.member_ids:
-                await self.__check_user_in_team(member_id, team_id)
-            stmt = select(User).where(User.id.in_(meeting_data.member_ids))
-            result = await self.session.execute(stmt)
-            users = result.scalars().all()
-            meeting.users = users
+            member_ids = await self.__check_team_members(meeting_data.member_ids, team_id)
 
+        # Changes are made inside the savepoint, so a slot collision only undoes this update.
         try:
-            await self.session.commit()
-            await self.session.refresh(meeting)
-        except SQLAlchemyError:
-            await self.session.rollback()
-            raise
+            async with self.session.begin_nested():
+                if meeting_data.name is not None:
+                    meeting.name = meeting_data.name
+                if meeting_data.date is not None:
+                    meeting.date = meeting_data.date
+                if meeting_data.time is not None:
+                    meeting.time = meeting_data.time
+                await self.session.flush()
+                if member_ids is not None:
+                    await self.__sync_meeting_members(meeting, member_ids)
+                    await self.session.refresh(meeting, attribute_names=['users'])
+        except IntegrityError:
+            raise ValueError('A meeting already exists at the given date and time') from None
 
         return meeting
 
@@ -287,28 +380,21 @@ class MeetingManager:
         Raises:
             LookupError: If the meeting is not found.
             PermissionError: If the meeting belongs to another team.
-            SQLAlchemyError: If a database error occurs during commit.
+            SQLAlchemyError: If a database error occurs during the delete.
         """
-        await self.__check_meeting_in_team(meeting_id, team_id)
+        stmt = delete(Meeting).where(Meeting.id == meeting_id, Meeting.team_id == team_id).returning(Meeting.id)
 
-        stmt = select(Meeting).where(Meeting.id == meeting_id)
         result = await self.session.execute(stmt)
-        meeting = result.scalar_one_or_none()
+        deleted_id = result.scalar_one_or_none()
 
-        if not meeting:
+        if deleted_id is None:
+            await self.__get_meeting_in_team(meeting_id, team_id)
             return False
 
-        await self.session.delete(meeting)
-        try:
-            await self.session.commit()
-        except SQLAlchemyError:
-            await self.session.rollback()
-            raise
-
         return True
 
 
-def get_meeting_manager(session: Annotated[AsyncSession, Depends(get_session)]) -> MeetingManager:
+async def get_meeting_manager(session: Annotated[AsyncSession, Depends(get_session)]) -> MeetingManager:
     """
     Dependency provider for MeetingManager.
 
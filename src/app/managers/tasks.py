@@ -1,11 +1,11 @@
-from datetime import date, datetime, timezone
+from collections.abc import AsyncIterator
 from typing import Annotated
 
 from fastapi import Depends
-from sqlalchemy import select
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import Row, Select, bindparam, delete, exists, func, insert, literal, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import contains_eager, raiseload
 
 from app.core.database import get_session
 from app.models.evaluations import Evaluation
@@ -14,6 +14,14 @@ from app.models.teams import UserTeam
 from app.schemas.evaluations import EvaluationSchema
 from app.schemas.tasks import TaskCreateSchema, TaskUpdateSchema
 
+TASKS_BATCH_SIZE = 500
+
+TASK_TEAM_ID_STMT = select(Task.team_id).where(Task.id == bindparam('task_id'))
+
+USER_IN_TEAM_STMT = select(
+    exists().where(UserTeam.user_id == bindparam('user_id'), UserTeam.team_id == bindparam('team_id'))
+)
+
 
 class TaskManager:
     """Manager class responsible for handling task-related operations in the database."""
@@ -26,10 +34,8 @@ class TaskManager:
             session (AsyncSession): SQLAlchemy asynchronous session for database interaction.
         """
         self.session = session
-
-    def __check_deadline(self, deadline: date):
-        if deadline < datetime.now(timezone.utc).date():
-            raise ValueError('Deadline cannot be in the past')
+        self._task_team_ok: set[tuple[int, int]] = set()
+        self._user_team_ok: set[tuple[int, int]] = set()
 
     async def __check_task_in_team(self, task_id: int, team_id: int):
         """
@@ -43,16 +49,20 @@ class TaskManager:
             LookupError: If the task is not found.
             PermissionError: If the task does not belong to the given team.
         """
-        stmt = select(Task).where(Task.id == task_id)
-        result = await self.session.execute(stmt)
-        task = result.scalar_one_or_none()
+        if (task_id, team_id) in self._task_team_ok:
+            return
+
+        result = await self.session.execute(TASK_TEAM_ID_STMT, {'task_id': task_id})
+        task_team_id = result.scalar_one_or_none()
 
-        if not task:
+        if task_team_id is None:
             raise LookupError('Task not found')
 
-        if task.team_id != team_id:
+        if task_team_id != team_id:
             raise PermissionError('Task does not belong to the team')
 
+        self._task_team_ok.add((task_id, team_id))
+
     async def __check_user_in_team(self, user_id: int, team_id: int):
         """
         Check whether a user belongs to the given team.
@@ -64,13 +74,16 @@ class TaskManager:
         Raises:
             LookupError: If the user is not found in the team.
         """
-        stmt = select(UserTeam).where(UserTeam.user_id == user_id, UserTeam.team_id == team_id)
-        result = await self.session.execute(stmt)
-        user = result.scalar_one_or_none()
+        if (user_id, team_id) in self._user_team_ok:
+            return
+
+        is_user_in_team = await self.session.scalar(USER_IN_TEAM_STMT, {'user_id': user_id, 'team_id': team_id})
 
-        if not user:
+        if not is_user_in_team:
             raise LookupError('User not found in this team')
 
+        self._user_team_ok.add((user_id, team_id))
+
     async def create_task(self, task_data: TaskCreateSchema, team_id: int) -> Task:
         """
         Create a new task in the database.
@@ -83,11 +96,8 @@ class TaskManager:
             Task: The newly created task object.
 
         Raises:
-            ValueError: If deadline is in the past.
-            SQLAlchemyError: If commit or refresh fails.
+            SQLAlchemyError: If flush fails.
         """
-        self.__check_deadline(task_data.deadline)
-
         await self.__check_user_in_team(task_data.performer_id, team_id)
 
         new_task = Task(
@@ -99,35 +109,129 @@ class TaskManager:
         )
         self.session.add(new_task)
 
-        try:
-            await self.session.commit()
-            await self.session.refresh(new_task)
-        except SQLAlchemyError:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
+        self._task_team_ok.add((new_task.id, team_id))
         return new_task
 
-    async def get_tasks_by_team(self, team_id: int, limit: int = 0, offset: int = 0) -> list[Task]:
+    async def create_tasks_bulk(self, tasks_data: list[TaskCreateSchema], team_id: int) -> list[Task]:
         """
-        Retrieve all tasks for a given team, including associated evaluation objects.
+        Create several tasks for a team with a single bulk INSERT.
 
         Args:
-            team_id (int): ID of the team.
+            tasks_data (list[TaskCreateSchema]): Data required to create the tasks.
+            team_id (int): ID of the team associated with the tasks.
 
         Returns:
-            list[Task]: List of Task objects. Each Task includes its evaluation if present.
+            list[Task]: The newly created task objects, in the given order.
+
+        Raises:
+            LookupError: If a performer is not found in the team.
+            SQLAlchemyError: If the insert fails.
+        """
+        if not tasks_data:
+            return []
+
+        performer_ids = {task_data.performer_id for task_data in tasks_data}
+        unchecked_ids = {user_id for user_id in performer_ids if (user_id, team_id) not in self._user_team_ok}
+        if unchecked_ids:
+            stmt = select(UserTeam.user_id).where(UserTeam.team_id == team_id, UserTeam.user_id.in_(unchecked_ids))
+            found_ids = set((await self.session.scalars(stmt)).all())
+            if unchecked_ids - found_ids:
+                raise LookupError('User not found in this team')
+            self._user_team_ok.update((user_id, team_id) for user_id in found_ids)
+
+        rows = [
+            {
+                'description': task_data.description,
+                'deadline': task_data.deadline,
+                'status': task_data.status,
+                'performer_id': task_data.performer_id,
+                'team_id': team_id,
+            }
+            for task_data in tasks_data
+        ]
+
+        result = await self.session.scalars(insert(Task).returning(Task, sort_by_parameter_order=True), rows)
+        new_tasks = result.all()
+
+        self._task_team_ok.update((new_task.id, team_id) for new_task in new_tasks)
+        return new_tasks
+
+    def __tasks_stmt(self, *criteria, limit: int, offset: int, cursor: int | None, rows: bool = False) -> Select:
+        """
+        Build the statement listing tasks together with their evaluations.
+
+        Args:
+            *criteria: Filters applied to the task query.
+            limit (int): Maximum number of tasks to return, 0 for no limit.
+            offset (int): Number of tasks to skip.
+            cursor (int | None): Return only tasks with a greater ID.
+            rows (bool, optional): Select plain task columns with the evaluation value
+                joined in as `evaluation` instead of ORM objects. Defaults to False.
+
+        Returns:
+            Select: Statement loading tasks with their evaluation joined in, ordered by ID.
         """
-        stmt = select(Task).where(Task.team_id == team_id).options(selectinload(Task.evaluation))
+        if rows:
+            stmt = select(*Task.__table__.c, Evaluation.value.label('evaluation'))
+        else:
+            stmt = select(Task).options(contains_eager(Task.evaluation), raiseload('*'))
+        stmt = stmt.outerjoin(Task.evaluation).where(*criteria).order_by(Task.id)
+        if cursor is not None:
+            stmt = stmt.where(Task.id > cursor)
         if limit:
             stmt = stmt.limit(limit)
         if offset:
             stmt = stmt.offset(offset)
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
+        return stmt
+
+    async def get_tasks_by_team(
+        self, team_id: int, limit: int = 0, offset: int = 0, cursor: int | None = None
+    ) -> list[Task]:
+        """
+        Retrieve all tasks for a given team, including associated evaluation objects.
+
+        Args:
+            team_id (int): ID of the team.
+            limit (int, optional): Maximum number of tasks to return. Defaults to 0 (no limit).
+            offset (int, optional): Number of tasks to skip. Defaults to 0.
+            cursor (int | None, optional): Return only tasks created after the task with this ID.
+                Cheaper than `offset` for deep pages. Defaults to None.
+
+        Returns:
+            list[Task]: List of Task objects. Each Task includes its evaluation if present.
+        """
+        stmt = self.__tasks_stmt(Task.team_id == team_id, limit=limit, offset=offset, cursor=cursor)
+        result = await self.session.scalars(stmt)
+        return result.all()
+
+    async def iter_tasks_by_team(
+        self, team_id: int, limit: int = 0, offset: int = 0, cursor: int | None = None
+    ) -> AsyncIterator[Row]:
+        """
+        Stream the tasks of a team as plain rows, in batches.
+
+        Rows skip ORM hydration and the identity map, which makes them the cheaper
+        choice for read-only listings.
+
+        Args:
+            team_id (int): ID of the team.
+            limit (int, optional): Maximum number of tasks to return. Defaults to 0 (no limit).
+            offset (int, optional): Number of tasks to skip. Defaults to 0.
+            cursor (int | None, optional): Return only tasks created after the task with this ID.
+                Defaults to None.
+
+        Yields:
+            Row: Task rows ordered by ID, with the evaluation value (or None) as `evaluation`.
+        """
+        stmt = self.__tasks_stmt(Task.team_id == team_id, limit=limit, offset=offset, cursor=cursor, rows=True)
+        result = await self.session.stream(stmt.execution_options(yield_per=TASKS_BATCH_SIZE))
+        async for row in result:
+            yield row
 
     async def get_tasks_by_performer(
-        self, performer_id: int, team_id: int, limit: int = 0, offset: int = 0
+        self, performer_id: int, team_id: int, limit: int = 0, offset: int = 0, cursor: int | None = None
     ) -> list[Task]:
         """
         Retrieve all tasks for a specific performer within a team, including evaluations.
@@ -135,24 +239,51 @@ class TaskManager:
         Args:
             performer_id (int): ID of the performer.
             team_id (int): ID of the team.
+            limit (int, optional): Maximum number of tasks to return. Defaults to 0 (no limit).
+            offset (int, optional): Number of tasks to skip. Defaults to 0.
+            cursor (int | None, optional): Return only tasks created after the task with this ID.
+                Defaults to None.
 
         Returns:
             list[Task]: List of Task objects assigned to the performer. Each Task includes
             its evaluation if present.
         """
-        stmt = (
-            select(Task)
-            .where(Task.performer_id == performer_id, Task.team_id == team_id)
-            .options(selectinload(Task.evaluation))
+        stmt = self.__tasks_stmt(
+            Task.performer_id == performer_id, Task.team_id == team_id, limit=limit, offset=offset, cursor=cursor
         )
-        if limit:
-            stmt = stmt.limit(limit)
-        if offset:
-            stmt = stmt.offset(offset)
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
+        result = await self.session.scalars(stmt)
+        return result.all()
 
-    async def update_task(self, task_data: TaskUpdateSchema, task_id: int, team_id: int) -> Task | None:
+    async def iter_tasks_by_performer(
+        self, performer_id: int, team_id: int, limit: int = 0, offset: int = 0, cursor: int | None = None
+    ) -> AsyncIterator[Row]:
+        """
+        Stream the tasks of a performer within a team as plain rows, in batches.
+
+        Args:
+            performer_id (int): ID of the performer.
+            team_id (int): ID of the team.
+            limit (int, optional): Maximum number of tasks to return. Defaults to 0 (no limit).
+            offset (int, optional): Number of tasks to skip. Defaults to 0.
+            cursor (int | None, optional): Return only tasks created after the task with this ID.
+                Defaults to None.
+
+        Yields:
+            Row: Task rows ordered by ID, with the evaluation value (or None) as `evaluation`.
+        """
+        stmt = self.__tasks_stmt(
+            Task.performer_id == performer_id,
+            Task.team_id == team_id,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            rows=True,
+        )
+        result = await self.session.stream(stmt.execution_options(yield_per=TASKS_BATCH_SIZE))
+        async for row in result:
+            yield row
+
+    async def update_task(self, task_data: TaskUpdateSchema, task_id: int, team_id: int) -> Task:
         """
         Update an existing task.
 
@@ -162,41 +293,41 @@ class TaskManager:
             team_id (int): ID of the team the task belongs to.
 
         Returns:
-            Task | None: Updated task object if found, otherwise None.
+            Task: Updated task object.
 
         Raises:
-            ValueError: If deadline is in the past.
-            SQLAlchemyError: If commit or refresh fails.
+            LookupError: If the task is not found or the performer is not in the team.
+            PermissionError: If the task does not belong to the given team.
+            SQLAlchemyError: If the update fails.
         """
-        if task_data.deadline is not None:
-            self.__check_deadline(task_data.deadline)
-
-        await self.__check_task_in_team(task_id, team_id)
-
-        stmt = select(Task).where(Task.id == task_id)
-        result = await self.session.execute(stmt)
-        task = result.scalar_one_or_none()
-
-        if not task:
-            return None
+        values = task_data.model_dump(exclude_unset=True, exclude_none=True)
+        if not values:
+            task = await self.session.get(Task, task_id)
+            if not task:
+                raise LookupError('Task not found')
+            if task.team_id != team_id:
+                raise PermissionError('Task does not belong to the team')
+            self._task_team_ok.add((task_id, team_id))
+            return task
 
-        if task_data.description is not None:
-            task.description = task_data.description
-        if task_data.deadline is not None:
-            task.deadline = task_data.deadline
-        if task_data.status is not None:
-            task.status = task_data.status
         if task_data.performer_id is not None:
             await self.__check_user_in_team(task_data.performer_id, team_id)
-            task.performer_id = task_data.performer_id
 
-        try:
-            await self.session.commit()
-            await self.session.refresh(task)
-        except SQLAlchemyError:
-            await self.session.rollback()
-            raise
+        stmt = (
+            update(Task)
+            .where(Task.id == task_id, Task.team_id == team_id)
+            .values(**values)
+            .returning(Task)
+            .execution_options(populate_existing=True, synchronize_session=False)
+        )
+
+        task = await self.session.scalar(stmt)
 
+        if task is None:
+            await self.__check_task_in_team(task_id, team_id)
+            raise LookupError('Task not found')
+
+        self._task_team_ok.add((task_id, team_id))
         return task
 
     async def delete_task(self, task_id: int, team_id: int) -> bool:
@@ -211,24 +342,20 @@ class TaskManager:
             bool: True if task was deleted, False if task was not found.
 
         Raises:
-            SQLAlchemyError: If commit fails.
+            LookupError: If the task is not found.
+            PermissionError: If the task does not belong to the given team.
+            SQLAlchemyError: If the delete fails.
         """
-        await self.__check_task_in_team(task_id, team_id)
+        stmt = delete(Task).where(Task.id == task_id, Task.team_id == team_id).returning(Task.id)
 
-        stmt = select(Task).where(Task.id == task_id)
         result = await self.session.execute(stmt)
-        task = result.scalar_one_or_none()
+        deleted_id = result.scalar_one_or_none()
 
-        if not task:
+        if deleted_id is None:
+            await self.__check_task_in_team(task_id, team_id)
             return False
 
-        await self.session.delete(task)
-        try:
-            await self.session.commit()
-        except SQLAlchemyError:
-            await self.session.rollback()
-            raise
-
+        self._task_team_ok.discard((task_id, team_id))
         return True
 
     async def update_task_evaluation(
@@ -249,35 +376,43 @@ class TaskManager:
 
         Returns:
             Evaluation: Updated or created evaluation object if successful.
-        """
-        await self.__check_task_in_team(task_id, team_id)
-
-        stmt = select(Evaluation).where(Evaluation.task_id == task_id)
-        result = await self.session.execute(stmt)
-        evaluation = result.scalar_one_or_none()
 
-        if evaluation:
-            evaluation.value = evaluation_data.value
-            evaluation.evaluator_id = evaluator_id
-        else:
-            evaluation = Evaluation(
-                value=evaluation_data.value,
-                evaluator_id=evaluator_id,
-                task_id=task_id,
+        Raises:
+            LookupError: If the task is not found.
+            PermissionError: If the task does not belong to the given team.
+            SQLAlchemyError: If the upsert fails.
+        """
+        insert_stmt = pg_insert(Evaluation).from_select(
+            ['value', 'evaluator_id', 'task_id'],
+            select(literal(evaluation_data.value), literal(evaluator_id), Task.id).where(
+                Task.id == task_id, Task.team_id == team_id
+            ),
+        )
+        stmt = (
+            insert_stmt.on_conflict_do_update(
+                index_elements=[Evaluation.task_id],
+                set_={
+                    'value': insert_stmt.excluded.value,
+                    'evaluator_id': insert_stmt.excluded.evaluator_id,
+                    'updated_at': func.now(),
+                },
             )
-            self.session.add(evaluation)
+            .returning(Evaluation)
+            .execution_options(populate_existing=True)
+        )
 
-        try:
-            await self.session.commit()
-            await self.session.refresh(evaluation)
-        except SQLAlchemyError:
-            await self.session.rollback()
-            raise
+        evaluation = await self.session.scalar(stmt)
+
+        if evaluation is None:
+            self._task_team_ok.discard((task_id, team_id))
+            await self.__check_task_in_team(task_id, team_id)
+            raise LookupError('Task not found')
 
+        self._task_team_ok.add((task_id, team_id))
         return evaluation
 
 
-def get_task_manager(session: Annotated[AsyncSession, Depends(get_session)]) -> TaskManager:
+async def get_task_manager(session: Annotated[AsyncSession, Depends(get_session)]) -> TaskManager:
     """
     Dependency function to provide a TaskManager instance.
 
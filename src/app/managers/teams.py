@@ -1,9 +1,10 @@
 from typing import Annotated
 
 from fastapi import Depends
-from sqlalchemy import func, select
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import bindparam, delete, exists, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from app.core.database import get_session
 from app.models.evaluations import Evaluation
@@ -12,6 +13,12 @@ from app.models.teams import Team, UserTeam
 from app.models.users import User
 from app.schemas.teams import TeamCreateSchema, UserRoles
 
+AVG_EVALUATION_STMT = (
+    select(func.avg(Evaluation.value))
+    .join(Task, Task.id == Evaluation.task_id)
+    .where(Task.performer_id == bindparam('user_id'), Task.team_id == bindparam('team_id'))
+)
+
 
 class TeamManager:
     """Manager class for handling operations related to Teams, Users, and their associations."""
@@ -39,14 +46,9 @@ class TeamManager:
         new_team = Team(name=team_data.name)
         self.session.add(new_team)
 
-        try:
-            await self.session.commit()
-            await self.session.refresh(new_team)
-        except SQLAlchemyError:
-            await self.session.rollback()
-            raise
-
-        await self.assign_role(user_id=user_to_admin.id, team_id=new_team.id, role=UserRoles.ADMIN)
+        await self.session.flush()
+        self.session.add(UserTeam(user_id=user_to_admin.id, team_id=new_team.id, role=UserRoles.ADMIN))
+        await self.session.flush()
 
         return new_team
 
@@ -63,22 +65,17 @@ class TeamManager:
         Returns:
             UserTeam: The updated or newly created user-team association.
         """
-        stmt = select(UserTeam).where(UserTeam.user_id == user_id, UserTeam.team_id == team_id)
-        existing_association = await self.session.scalar(stmt)
-
-        if existing_association:
-            existing_association.role = role
-            user_team_association = existing_association
-        else:
-            user_team_association = UserTeam(user_id=user_id, team_id=team_id, role=role)
-            self.session.add(user_team_association)
-
-        try:
-            await self.session.commit()
-            await self.session.refresh(user_team_association)
-        except SQLAlchemyError:
-            await self.session.rollback()
-            raise
+        insert_stmt = pg_insert(UserTeam).values(user_id=user_id, team_id=team_id, role=role)
+        stmt = (
+            insert_stmt.on_conflict_do_update(
+                constraint='unique_user_team',
+                set_={'role': insert_stmt.excluded.role, 'updated_at': func.now()},
+            )
+            .returning(UserTeam)
+            .execution_options(populate_existing=True)
+        )
+
+        user_team_association = await self.session.scalar(stmt)
 
         return user_team_association
 
@@ -93,7 +90,10 @@ class TeamManager:
             list[tuple[User, UserRoles]]: List of users with their assigned roles.
         """
         stmt = (
-            select(User, UserTeam.role).join(UserTeam, UserTeam.user_id == User.id).where(UserTeam.team_id == team_id)
+            select(User, UserTeam.role)
+            .join(UserTeam, UserTeam.user_id == User.id)
+            .where(UserTeam.team_id == team_id)
+            .options(raiseload('*'))
         )
         if limit:
             stmt = stmt.limit(limit)
@@ -114,7 +114,10 @@ class TeamManager:
             list[tuple[Team, UserRoles]]: List of teams with the user's role in each.
         """
         stmt = (
-            select(Team, UserTeam.role).join(UserTeam, UserTeam.team_id == Team.id).where(UserTeam.user_id == user_id)
+            select(Team, UserTeam.role)
+            .join(UserTeam, UserTeam.team_id == Team.id)
+            .where(UserTeam.user_id == user_id)
+            .options(raiseload('*'))
         )
         if limit:
             stmt = stmt.limit(limit)
@@ -136,33 +139,23 @@ class TeamManager:
         Returns:
             bool: True if the association was deleted, False if not found.
         """
-        stmt = select(UserTeam).where(UserTeam.user_id == user_id, UserTeam.team_id == team_id)
-        result = await self.session.execute(stmt)
-        association = result.scalar_one_or_none()
-
-        if not association:
-            return False
-
-        await self.session.delete(association)
-        await self.session.flush()
-
-        check_stmt = select(UserTeam).where(UserTeam.team_id == team_id)
-        remaining = await self.session.execute(check_stmt)
-        if not remaining.first():
-            team_stmt = select(Team).where(Team.id == team_id)
-            team_result = await self.session.execute(team_stmt)
-            team = team_result.scalar_one_or_none()
-            if team:
-                await self.session.delete(team)
-                await self.session.flush()
+        deleted_membership = (
+            delete(UserTeam)
+            .where(UserTeam.user_id == user_id, UserTeam.team_id == team_id)
+            .returning(UserTeam.team_id)
+            .cte('deleted_membership')
+        )
+        # The CTEs share the statement's snapshot, so the membership being deleted is
+        # still visible here and has to be excluded explicitly.
+        deleted_team = delete(Team).where(
+            Team.id.in_(select(deleted_membership.c.team_id)),
+            ~exists().where(UserTeam.team_id == team_id, UserTeam.user_id != user_id),
+        )
+        stmt = select(deleted_membership.c.team_id).add_cte(deleted_team.cte('deleted_team'))
 
-        try:
-            await self.session.commit()
-        except SQLAlchemyError:
-            await self.session.rollback()
-            raise
+        deleted_team_id = await self.session.scalar(stmt)
 
-        return True
+        return deleted_team_id is not None
 
     async def get_avg_evaluation(self, user_id: int, team_id: int) -> float:
         """
@@ -175,17 +168,12 @@ class TeamManager:
         Returns:
             float: The average evaluation rounded to 2 decimal places, or 0.0 if no evaluation exists.
         """
-        stmt = (
-            select(func.avg(Evaluation.value))
-            .join(Task, Task.id == Evaluation.task_id)
-            .where(Task.performer_id == user_id, Task.team_id == team_id)
-        )
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(AVG_EVALUATION_STMT, {'user_id': user_id, 'team_id': team_id})
         avg = result.scalar_one_or_none()
         return round(float(avg), 2) if avg is not None else 0.0
 
 
-def get_team_manager(session: Annotated[AsyncSession, Depends(get_session)]) -> TeamManager:
+async def get_team_manager(session: Annotated[AsyncSession, Depends(get_session)]) -> TeamManager:
     """
     Dependency function to provide a TeamManager instance.
 
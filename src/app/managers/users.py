@@ -1,16 +1,50 @@
+import asyncio
+import hmac
+import time
 from typing import Annotated
 
 from fastapi import Depends
-from sqlalchemy import select
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import bindparam, delete, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import config
 from app.core.database import get_session
 from app.core.security import HashingMixin
 from app.models.users import User
 from app.schemas.auth import CredentialsSchema
 from app.schemas.users import UserCreateSchema, UserUpdateSchema
 
+PASSWORD_HASH_BY_EMAIL_STMT = select(User.hashed_password).where(User.email == bindparam('email'))
+
+# Hash of 'dummy-password' made with the parameters of `password_hasher`, so verifying against it costs
+# as much as a real check. It is precomputed to keep Argon2 out of the module import.
+DUMMY_PASSWORD_HASH = (
+    '$argon2id$v=19$m=102400,t=2,p=4$xq/86eCxy/MC3q8ky64Y0Q$Aq1FT5xq24tnBl9Zgh64vAdDBFINO0l2N57JzjC/6Ak'
+)
+
+VERIFIED_CREDENTIALS_TTL = 60
+VERIFIED_CREDENTIALS_MAX_SIZE = 10_000
+
+# Expiry time of recently verified credentials, keyed by an HMAC of the stored hash and the password.
+# Entries are kept in expiry order: refreshed keys are moved to the end, so the oldest entry is always first.
+verified_credentials: dict[bytes, float] = {}
+
+
+def remember_verified_credentials(cache_key: bytes) -> None:
+    """
+    Store a verified credentials key, purging expired entries and evicting the oldest one when full.
+
+    Args:
+        cache_key (bytes): HMAC of the stored hash and the password.
+    """
+    now = time.monotonic()
+    verified_credentials.pop(cache_key, None)
+    while verified_credentials and next(iter(verified_credentials.values())) <= now:
+        del verified_credentials[next(iter(verified_credentials))]
+    if len(verified_credentials) >= VERIFIED_CREDENTIALS_MAX_SIZE:
+        del verified_credentials[next(iter(verified_credentials))]
+    verified_credentials[cache_key] = now + VERIFIED_CREDENTIALS_TTL
+
 
 class UserManager(HashingMixin):
     """
@@ -19,6 +53,10 @@ class UserManager(HashingMixin):
     Provides methods to create, update, delete users,
     and validate user credentials.
 
+    Changes are not committed here, the request's session owns the transaction.
+    Writes that can hit a unique constraint run in a savepoint, so a duplicate
+    email or username only undoes that statement.
+
     Inherits:
         HashingMixin: Provides password hashing and verification utilities.
     """
@@ -34,7 +72,7 @@ class UserManager(HashingMixin):
 
     async def create_user(self, user_data: UserCreateSchema) -> User:
         """
-        Create a new user and persist it to the database.
+        Create a new user with a single INSERT ... RETURNING statement.
 
         Args:
             user_data (UserCreateSchema): Pydantic schema with user creation data.
@@ -45,48 +83,105 @@ class UserManager(HashingMixin):
         Raises:
             IntegrityError: If a user with the same email or username already exists.
         """
-        new_user = User(
-            username=user_data.username,
-            email=user_data.email,
-            hashed_password=self.hash_password(user_data.password),
-            first_name=user_data.first_name,
-            last_name=user_data.last_name,
-            is_admin=False,
+        stmt = (
+            insert(User)
+            .values(
+                username=user_data.username,
+                email=user_data.email,
+                hashed_password=await self.hash_password_async(user_data.password),
+                first_name=user_data.first_name,
+                last_name=user_data.last_name,
+                is_admin=False,
+            )
+            .returning(User)
         )
-        self.session.add(new_user)
 
-        try:
-            await self.session.commit()
-        except IntegrityError:
-            await self.session.rollback()
-            raise
+        async with self.session.begin_nested():
+            new_user = await self.session.scalar(stmt)
 
-        await self.session.refresh(new_user)
         return new_user
 
+    async def create_users(self, users_data: list[UserCreateSchema]) -> list[User]:
+        """
+        Create several users with a single bulk INSERT.
+
+        Passwords are hashed concurrently on the hashing thread pool before the insert.
+
+        Args:
+            users_data (list[UserCreateSchema]): Pydantic schemas with user creation data.
+
+        Returns:
+            list[User]: The newly created user instances, in the given order.
+
+        Raises:
+            IntegrityError: If any email or username is already taken.
+        """
+        if not users_data:
+            return []
+
+        hashed_passwords = await asyncio.gather(
+            *(self.hash_password_async(user_data.password) for user_data in users_data)
+        )
+        rows = [
+            {
+                'username': user_data.username,
+                'email': user_data.email,
+                'hashed_password': hashed_password,
+                'first_name': user_data.first_name,
+                'last_name': user_data.last_name,
+                'is_admin': False,
+            }
+            for user_data, hashed_password in zip(users_data, hashed_passwords)
+        ]
+
+        async with self.session.begin_nested():
+            result = await self.session.scalars(insert(User).returning(User, sort_by_parameter_order=True), rows)
+            new_users = result.all()
+
+        return new_users
+
     async def check_user_by_credentials(self, credentials: CredentialsSchema) -> bool:
         """
         Verify user credentials by email and password.
 
+        The password hash is verified even when no user has the given email, so the
+        response time does not reveal which emails are registered. Successful checks
+        are remembered for a short time, keyed by an HMAC of the stored hash and the
+        password, so repeated logins skip the hash and a password change invalidates them.
+
         Args:
             credentials (CredentialsSchema): User credentials schema.
 
         Returns:
             bool: True if credentials are valid, False otherwise.
         """
-        stmt = select(User).where(User.email == credentials.email)
-        result = await self.session.execute(stmt)
-        user = result.scalar_one_or_none()
+        hashed_password = await self.session.scalar(PASSWORD_HASH_BY_EMAIL_STMT, {'email': credentials.email})
 
-        if not user or not self.verify_password(credentials.password, user.hashed_password):
-            return False
+        cache_key = None
+        if hashed_password is not None:
+            cache_key = hmac.digest(
+                config.SECRET_KEY.encode(), f'{hashed_password}:{credentials.password}'.encode(), 'sha256'
+            )
+            # Timing trade-off: a hit skips Argon2 and answers much faster than a miss. It can only be
+            # observed by someone who already sent the correct password for this account within the TTL,
+            # so it reveals nothing new, while repeated logins stop paying for a full hash.
+            if verified_credentials.get(cache_key, 0) > time.monotonic():
+                return True
 
-        return True
+        # Unknown emails are verified against a dummy hash so they take as long as a wrong password.
+        is_valid = await self.verify_password_async(credentials.password, hashed_password or DUMMY_PASSWORD_HASH)
+
+        if cache_key is not None and is_valid:
+            remember_verified_credentials(cache_key)
+
+        return (hashed_password is not None) & is_valid
 
     async def update_user(self, user: User, user_data: UserUpdateSchema) -> User:
         """
         Update an existing user with new values.
 
+        Only the fields supplied in `user_data` are written, in a single UPDATE ... RETURNING statement.
+
         Args:
             user (User): The user instance to update.
             user_data (UserUpdateSchema): Pydantic schema with updated fields.
@@ -97,41 +192,42 @@ class UserManager(HashingMixin):
         Raises:
             IntegrityError: If updated values violate unique constraints (e.g., duplicate email/username).
         """
-        if user_data.username is not None:
-            user.username = user_data.username
-        if user_data.email is not None:
-            user.email = user_data.email
-        if user_data.password is not None:
-            user.hashed_password = self.hash_password(user_data.password)
-        if user_data.first_name is not None:
-            user.first_name = user_data.first_name
-        if user_data.last_name is not None:
-            user.last_name = user_data.last_name
-
-        try:
-            await self.session.commit()
-        except IntegrityError:
-            await self.session.rollback()
-            raise
-
-        await self.session.refresh(user)
+        values = user_data.model_dump(exclude_unset=True, exclude_none=True)
+        if 'password' in values:
+            values['hashed_password'] = await self.hash_password_async(values.pop('password'))
+        if not values:
+            return user
+
+        stmt = (
+            update(User)
+            .where(User.id == user.id)
+            .values(**values)
+            .returning(User)
+            .execution_options(populate_existing=True, synchronize_session=False)
+        )
+
+        async with self.session.begin_nested():
+            user = await self.session.scalar(stmt)
+
         return user
 
     async def delete_user(self, user: User) -> None:
         """
         Permanently delete a user from the database.
 
+        Rows referencing the user are removed or detached by the database through the
+        foreign keys' ON DELETE actions, so no related collections are loaded.
+
         Args:
             user (User): The user instance to delete.
 
         Returns:
             None
         """
-        await self.session.delete(user)
-        await self.session.commit()
+        await self.session.execute(delete(User).where(User.id == user.id))
 
 
-def get_user_manager(session: Annotated[AsyncSession, Depends(get_session)]) -> UserManager:
+async def get_user_manager(session: Annotated[AsyncSession, Depends(get_session)]) -> UserManager:
     """
     Dependency provider for UserManager.
 
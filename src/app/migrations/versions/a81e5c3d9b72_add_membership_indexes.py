@@ -0,0 +1,49 @@
+"""Add membership indexes
+
+Revision ID: a81e5c3d9b72
+Revises: 6d3f8b2a7c51
+Create Date: 2026-10-16 15:22:48.190374
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a81e5c3d9b72'
+down_revision: Union[str, Sequence[str], None] = '6d3f8b2a7c51'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_user_team_association_team_id_user_id',
+            'user_team_association',
+            ['team_id', 'user_id'],
+            unique=False,
+            postgresql_include=['role'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_user_meeting_meeting_id',
+            'user_meeting',
+            ['meeting_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_user_meeting_meeting_id', table_name='user_meeting', postgresql_concurrently=True)
+        op.drop_index(
+            'ix_user_team_association_team_id_user_id',
+            table_name='user_team_association',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,64 @@
+"""Store enums as chars
+
+Revision ID: b3e9a4f7c218
+Revises: f4b7d2c91e06
+Create Date: 2026-10-16 16:41:37.508213
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e9a4f7c218'
+down_revision: Union[str, Sequence[str], None] = 'f4b7d2c91e06'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        'tasks',
+        'status',
+        type_=sa.String(length=1),
+        existing_nullable=False,
+        postgresql_using="CASE status WHEN 'OPEN' THEN 'o' WHEN 'WORK' THEN 'w' ELSE 'c' END",
+    )
+    op.create_check_constraint('ck_tasks_status', 'tasks', "status IN ('o', 'w', 'c')")
+    op.alter_column(
+        'user_team_association',
+        'role',
+        type_=sa.String(length=1),
+        existing_nullable=False,
+        postgresql_using="CASE role WHEN 'USER' THEN 'u' WHEN 'MANAGER' THEN 'm' ELSE 'a' END",
+    )
+    op.create_check_constraint('ck_user_team_association_role', 'user_team_association', "role IN ('u', 'm', 'a')")
+    sa.Enum(name='task_status_enum').drop(op.get_bind())
+    sa.Enum(name='user_role_enum').drop(op.get_bind())
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    sa.Enum('USER', 'MANAGER', 'ADMIN', name='user_role_enum').create(op.get_bind())
+    sa.Enum('OPEN', 'WORK', 'COMPLETED', name='task_status_enum').create(op.get_bind())
+    op.drop_constraint('ck_user_team_association_role', 'user_team_association', type_='check')
+    op.alter_column(
+        'user_team_association',
+        'role',
+        type_=sa.Enum('USER', 'MANAGER', 'ADMIN', name='user_role_enum'),
+        existing_nullable=False,
+        postgresql_using="(CASE role WHEN 'u' THEN 'USER' WHEN 'm' THEN 'MANAGER' ELSE 'ADMIN' END)::user_role_enum",
+    )
+    op.drop_constraint('ck_tasks_status', 'tasks', type_='check')
+    op.alter_column(
+        'tasks',
+        'status',
+        type_=sa.Enum('OPEN', 'WORK', 'COMPLETED', name='task_status_enum'),
+        existing_nullable=False,
+        postgresql_using=(
+            "(CASE status WHEN 'o' THEN 'OPEN' WHEN 'w' THEN 'WORK' ELSE 'COMPLETED' END)::task_status_enum"
+        ),
+    )
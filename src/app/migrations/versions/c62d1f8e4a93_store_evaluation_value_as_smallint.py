@@ -0,0 +1,33 @@
+"""Store evaluation value as smallint
+
+Revision ID: c62d1f8e4a93
+Revises: b3e9a4f7c218
+Create Date: 2026-10-16 17:02:19.846130
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c62d1f8e4a93'
+down_revision: Union[str, Sequence[str], None] = 'b3e9a4f7c218'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        'evaluations', 'value', type_=sa.SmallInteger(), existing_type=sa.Integer(), existing_nullable=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        'evaluations', 'value', type_=sa.Integer(), existing_type=sa.SmallInteger(), existing_nullable=False
+    )
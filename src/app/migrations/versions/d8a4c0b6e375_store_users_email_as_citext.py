@@ -0,0 +1,30 @@
+"""Store users email as citext
+
+Revision ID: d8a4c0b6e375
+Revises: c62d1f8e4a93
+Create Date: 2026-10-16 17:24:51.093864
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8a4c0b6e375'
+down_revision: Union[str, Sequence[str], None] = 'c62d1f8e4a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS citext')
+    op.alter_column('users', 'email', type_=postgresql.CITEXT(), existing_type=sa.String(), existing_nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('users', 'email', type_=sa.String(), existing_type=postgresql.CITEXT(), existing_nullable=False)
@@ -0,0 +1,39 @@
+"""Cover users email index
+
+Revision ID: f4b7d2c91e06
+Revises: a81e5c3d9b72
+Create Date: 2026-10-16 16:05:12.734519
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4b7d2c91e06'
+down_revision: Union[str, Sequence[str], None] = 'a81e5c3d9b72'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_email_covering',
+            'users',
+            ['email'],
+            unique=True,
+            postgresql_include=['hashed_password'],
+            postgresql_concurrently=True,
+        )
+    op.drop_constraint('users_email_key', 'users', type_='unique')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_unique_constraint('users_email_key', 'users', ['email'])
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_users_email_covering', table_name='users', postgresql_concurrently=True)
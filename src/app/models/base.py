@@ -15,6 +15,8 @@ class Base(DeclarativeBase):
     created_at: Mapped[datetime] = mapped_column(server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(server_default=func.now(), onupdate=func.now())
 
+    __mapper_args__ = {'eager_defaults': True}
+
     registry = registry(
         type_annotation_map={
             str_1: String(1),
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -19,3 +19,5 @@ class Comment(Base):
 
     user: Mapped['User'] = relationship(back_populates='comments')
     task: Mapped['Task'] = relationship(back_populates='comments')
+
+    __table_args__ = (Index('ix_comments_task_id_id', 'task_id', 'id'),)
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import CheckConstraint, ForeignKey
+from sqlalchemy import CheckConstraint, ForeignKey, SmallInteger
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -13,7 +13,7 @@ if TYPE_CHECKING:
 class Evaluation(Base):
     __tablename__ = 'evaluations'
 
-    value: Mapped[int]
+    value: Mapped[int] = mapped_column(SmallInteger)
     evaluator_id: Mapped[int] = mapped_column(ForeignKey('users.id', ondelete='CASCADE'))
     task_id: Mapped[int] = mapped_column(ForeignKey('tasks.id', ondelete='CASCADE'), unique=True)
 
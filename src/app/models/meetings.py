@@ -1,7 +1,7 @@
 from datetime import date, time
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Column, ForeignKey, Table
+from sqlalchemy import Column, ForeignKey, Index, Table, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, str_100
@@ -15,6 +15,7 @@ user_meeting_association = Table(
     Base.metadata,
     Column('user_id', ForeignKey('users.id', ondelete='CASCADE'), primary_key=True),
     Column('meeting_id', ForeignKey('meetings.id', ondelete='CASCADE'), primary_key=True),
+    Index('ix_user_meeting_meeting_id', 'meeting_id'),
 )
 
 
@@ -30,6 +31,12 @@ class Meeting(Base):
         'User',
         secondary=user_meeting_association,
         back_populates='meetings',
-        lazy='selectin',
+        lazy='raise_on_sql',
+        passive_deletes=True,
     )
     team: Mapped['Team'] = relationship(back_populates='meetings')
+
+    __table_args__ = (
+        Index('ix_meetings_team_id_id', 'team_id', 'id'),
+        UniqueConstraint('team_id', 'date', 'time', name='uq_meetings_team_id_date_time'),
+    )
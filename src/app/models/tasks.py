@@ -3,7 +3,7 @@ from enum import Enum
 from typing import TYPE_CHECKING, Optional
 
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -27,7 +27,14 @@ class Task(Base):
     description: Mapped[str]
     deadline: Mapped[date]
     status: Mapped['TaskStatuses'] = mapped_column(
-        SQLEnum(TaskStatuses, name='task_status_enum', native_enum=True),
+        SQLEnum(
+            TaskStatuses,
+            name='ck_tasks_status',
+            native_enum=False,
+            create_constraint=True,
+            length=1,
+            values_callable=lambda statuses: [status.value for status in statuses],
+        ),
         default=TaskStatuses.OPEN,
     )
     performer_id: Mapped[int | None] = mapped_column(ForeignKey('users.id', ondelete='SET NULL'))
@@ -37,3 +44,8 @@ class Task(Base):
     team: Mapped['Team'] = relationship(back_populates='tasks')
     comments: Mapped[list['Comment']] = relationship(back_populates='task', passive_deletes=True)
     evaluation: Mapped[Optional['Evaluation']] = relationship(back_populates='task', passive_deletes=True)
+
+    __table_args__ = (
+        Index('ix_tasks_team_id_id', 'team_id', 'id'),
+        Index('ix_tasks_performer_id_team_id_id', 'performer_id', 'team_id', 'id'),
+    )
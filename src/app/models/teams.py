@@ -2,7 +2,7 @@ from enum import Enum
 from typing import TYPE_CHECKING
 
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import ForeignKey, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, str_100
@@ -36,11 +36,21 @@ class UserTeam(Base):
     team_id: Mapped[int] = mapped_column(ForeignKey('teams.id', ondelete='CASCADE'))
 
     role: Mapped['UserRoles'] = mapped_column(
-        SQLEnum(UserRoles, name='user_role_enum', native_enum=True),
+        SQLEnum(
+            UserRoles,
+            name='ck_user_team_association_role',
+            native_enum=False,
+            create_constraint=True,
+            length=1,
+            values_callable=lambda roles: [role.value for role in roles],
+        ),
         default=UserRoles.USER,
     )
 
     user: Mapped['User'] = relationship(back_populates='teams')
     team: Mapped['Team'] = relationship(back_populates='members', passive_deletes=True)
 
-    __table_args__ = (UniqueConstraint('user_id', 'team_id', name='unique_user_team'),)
+    __table_args__ = (
+        UniqueConstraint('user_id', 'team_id', name='unique_user_team'),
+        Index('ix_user_team_association_team_id_user_id', 'team_id', 'user_id', postgresql_include=['role']),
+    )
@@ -1,3 +1,5 @@
+from sqlalchemy import DDL, Index, event
+from sqlalchemy.dialects.postgresql import CITEXT
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, str_100
@@ -12,7 +14,7 @@ class User(Base):
     __tablename__ = 'users'
 
     username: Mapped[str_100] = mapped_column(unique=True)
-    email: Mapped[str] = mapped_column(unique=True)
+    email: Mapped[str] = mapped_column(CITEXT)
     hashed_password: Mapped[str_100]
     first_name: Mapped[str_100]
     last_name: Mapped[str_100 | None]
@@ -27,3 +29,8 @@ class User(Base):
         back_populates='users',
     )
     evaluations: Mapped[list['Evaluation']] = relationship(back_populates='evaluator', passive_deletes=True)
+
+    __table_args__ = (Index('ix_users_email_covering', 'email', unique=True, postgresql_include=['hashed_password']),)
+
+
+event.listen(User.__table__, 'before_create', DDL('CREATE EXTENSION IF NOT EXISTS citext'))
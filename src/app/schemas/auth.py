@@ -1,12 +1,28 @@
-from pydantic import EmailStr
+import re
+
+from pydantic import field_validator
+from pydantic.networks import validate_email
 
 from .base import BaseResponseSchema, BaseSchema
 
+LOGIN_EMAIL_PATTERN = re.compile(r'[^@\s]{1,64}@[^@\s]{1,255}')
+
+
+def normalize_login_email(email: str) -> str:
+    if email.isascii() and LOGIN_EMAIL_PATTERN.fullmatch(email):
+        local_part, domain = email.split('@')
+        return f'{local_part}@{domain.lower()}'
+    return validate_email(email)[1]
+
 
 class CredentialsSchema(BaseSchema):
-    email: EmailStr
+    email: str
     password: str
 
+    @field_validator('email')
+    def check_email(cls, value):
+        return normalize_login_email(value)
+
 
 class TokenSchema(BaseSchema):
     access_token: str
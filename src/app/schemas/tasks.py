@@ -1,11 +1,17 @@
-from datetime import date
+from datetime import UTC, date, datetime
 from enum import Enum
 
-from pydantic import Field, model_validator
+from pydantic import Field, field_validator, model_validator
 
 from .base import BaseCreateSchema, BaseModelSchema, BaseResponseSchema, BaseUpdateSchema
 
 
+def ensure_deadline_not_past(deadline: date | None) -> date | None:
+    if deadline is not None and deadline < datetime.now(UTC).date():
+        raise ValueError('Deadline cannot be in the past')
+    return deadline
+
+
 class TaskStatuses(str, Enum):
     OPEN = 'o'
     WORK = 'w'
@@ -23,7 +29,7 @@ class TaskSchema(BaseModelSchema):
     @model_validator(mode='before')
     def extract_evaluation(cls, values):
         evaluation_obj = getattr(values, 'evaluation', None)
-        if evaluation_obj is not None:
+        if evaluation_obj is not None and not isinstance(evaluation_obj, int):
             values_dict = values.__dict__.copy()
             values_dict['evaluation'] = evaluation_obj.value
             return values_dict
@@ -36,6 +42,10 @@ class TaskCreateSchema(BaseCreateSchema):
     status: TaskStatuses = TaskStatuses.OPEN
     performer_id: int | None = Field(ge=1, default=None)
 
+    @field_validator('deadline')
+    def check_deadline(cls, value):
+        return ensure_deadline_not_past(value)
+
 
 class TaskCreateSuccessSchema(BaseResponseSchema):
     task_id: int
@@ -48,6 +58,10 @@ class TaskUpdateSchema(BaseUpdateSchema):
     status: TaskStatuses | None = None
     performer_id: int | None = None
 
+    @field_validator('deadline')
+    def check_deadline(cls, value):
+        return ensure_deadline_not_past(value)
+
 
 class TaskUpdateSuccessSchema(BaseResponseSchema):
     detail: str = 'The task has been successfully updated'
@@ -95,7 +95,7 @@ class AuthService(TokenMixin):
         return LogoutSuccessSchema()
 
 
-def get_auth_service(manager: Annotated[UserManager, Depends(get_user_manager)]) -> AuthService:
+async def get_auth_service(manager: Annotated[UserManager, Depends(get_user_manager)]) -> AuthService:
     """
     Dependency provider for AuthService.
 
@@ -37,13 +37,12 @@ class CalendarService:
         Returns:
             CalendarDateSchema: Schema containing the date and the list of events.
         """
-        tasks = await self.task_manager.get_tasks_by_team(team_id)
-        meetings = await self.meeting_manager.get_meetings_by_team(team_id)
-
         events = []
-        for task in tasks:
+        async for task in self.task_manager.iter_tasks_by_team(team_id):
             if task.deadline == date:
                 events.append(TaskSchema.model_validate(task))
+
+        meetings = await self.meeting_manager.get_meetings_by_team(team_id)
         for meeting in meetings:
             if meeting.date == date:
                 events.append(MeetingSchema.model_validate(meeting))
@@ -62,21 +61,46 @@ class CalendarService:
         Returns:
             CalendarMonthSchema: Schema containing year, month, and the list of events.
         """
-        tasks = await self.task_manager.get_tasks_by_team(team_id)
-        meetings = await self.meeting_manager.get_meetings_by_team(team_id)
-
         events = []
-        for task in tasks:
+        async for task in self.task_manager.iter_tasks_by_team(team_id):
             if task.deadline.year == year and task.deadline.month == month:
                 events.append(TaskSchema.model_validate(task))
+
+        meetings = await self.meeting_manager.get_meetings_by_team(team_id)
         for meeting in meetings:
             if meeting.date.year == year and meeting.date.month == month:
                 events.append(MeetingSchema.model_validate(meeting))
 
         return CalendarMonthSchema(year=year, month=month, events=events)
 
+    async def get_calendar_by_date_and_month(
+        self, team_id: int, date: datetime.date
+    ) -> tuple[CalendarDateSchema, CalendarMonthSchema]:
+        """
+        Retrieve the events of a specific date and of its month with a single fetch.
+
+        The month events are loaded once and the day events are taken from them,
+        since the date always falls inside its own month.
+
+        Args:
+            team_id (int): ID of the team.
+            date (datetime.date): Target date; its year and month define the month calendar.
+
+        Returns:
+            tuple[CalendarDateSchema, CalendarMonthSchema]: Calendars for the date and for its month.
+        """
+        calendar_month = await self.get_calendar_by_month(team_id, date.year, date.month)
+
+        events = []
+        for event in calendar_month.events:
+            event_date = event.deadline if isinstance(event, TaskSchema) else event.date
+            if event_date == date:
+                events.append(event)
+
+        return CalendarDateSchema(date=date, events=events), calendar_month
+
 
-def get_calendar_service(
+async def get_calendar_service(
     task_manager: Annotated[TaskManager, Depends(get_task_manager)],
     meeting_manager: Annotated[MeetingManager, Depends(get_meeting_manager)],
 ) -> CalendarService:
@@ -71,7 +71,7 @@ class CommentService:
         return CommentCreateSuccessSchema(comment_id=new_comment.id)
 
     async def get_comments_by_task(
-        self, task_id: int, team_id: int, limit: int = 0, offset: int = 0
+        self, task_id: int, team_id: int, limit: int = 0, offset: int = 0, cursor: int | None = None
     ) -> list[CommentSchema]:
         """
         Retrieve all comments for a specific task.
@@ -81,6 +81,7 @@ class CommentService:
             team_id (int): ID of the team the task belongs to.
             limit (int, optional): Maximum number of comments to retrieve. Defaults to 0 (no limit).
             offset (int, optional): Number of comments to skip before returning results. Defaults to 0.
+            cursor (int | None, optional): ID of the last comment of the previous page. Defaults to None.
 
         Returns:
             list[CommentSchema]: List of comments for the specified task.
@@ -89,7 +90,10 @@ class CommentService:
             HTTPException: If the task is not found or access is denied.
         """
         try:
-            comments = await self.manager.get_comments_by_task(task_id, team_id, limit, offset)
+            return [
+                CommentSchema.model_validate(comment)
+                async for comment in self.manager.iter_comments_by_task(task_id, team_id, limit, offset, cursor)
+            ]
         except LookupError as e:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -100,7 +104,6 @@ class CommentService:
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f'{e}',
             )
-        return [CommentSchema.model_validate(comment) for comment in comments]
 
     async def delete_comment(self, comment_id: int, task_id: int, team_id: int) -> None:
         """
@@ -133,7 +136,7 @@ class CommentService:
             )
 
 
-def get_comment_service(manager: Annotated[CommentManager, Depends(get_comment_manager)]) -> CommentService:
+async def get_comment_service(manager: Annotated[CommentManager, Depends(get_comment_manager)]) -> CommentService:
     """
     Dependency injector for CommentService.
 
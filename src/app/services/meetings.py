@@ -76,7 +76,9 @@ class MeetingService:
             )
         return MeetingCreateSuccessSchema(meeting_id=new_meeting.id)
 
-    async def get_meetings_by_team(self, team_id: int, limit: int = 0, offset: int = 0) -> list[MeetingSchema]:
+    async def get_meetings_by_team(
+        self, team_id: int, limit: int = 0, offset: int = 0, cursor: int | None = None
+    ) -> list[MeetingSchema]:
         """
         Retrieve all meetings for a specific team.
 
@@ -84,11 +86,12 @@ class MeetingService:
             team_id (int): ID of the team.
             limit (int, optional): Maximum number of meetings to retrieve. Defaults to 0 (no limit).
             offset (int, optional): Number of meetings to skip before returning results. Defaults to 0.
+            cursor (int | None, optional): ID of the last meeting of the previous page. Defaults to None.
 
         Returns:
             list[MeetingSchema]: List of meeting schemas for the specified team.
         """
-        meetings = await self.manager.get_meetings_by_team(team_id, limit, offset)
+        meetings = await self.manager.get_meetings_by_team(team_id, limit, offset, cursor)
         return [MeetingSchema.model_validate(meeting) for meeting in meetings]
 
     async def get_meetings_by_member(
@@ -186,7 +189,7 @@ class MeetingService:
             )
 
 
-def get_meeting_service(manager: Annotated[MeetingManager, Depends(get_meeting_manager)]) -> MeetingService:
+async def get_meeting_service(manager: Annotated[MeetingManager, Depends(get_meeting_manager)]) -> MeetingService:
     """
     Dependency injector for MeetingService.
 
@@ -52,7 +52,7 @@ class RegisterService:
         return UserCreateSuccessSchema(user_id=new_user.id)
 
 
-def get_register_service(manager: Annotated[UserManager, Depends(get_user_manager)]) -> RegisterService:
+async def get_register_service(manager: Annotated[UserManager, Depends(get_user_manager)]) -> RegisterService:
     """
     Dependency injector for RegisterService.
 
@@ -78,7 +78,9 @@ class TaskService:
             )
         return TaskCreateSuccessSchema(task_id=new_task.id)
 
-    async def get_tasks_by_team(self, team_id: int, limit: int = 0, offset: int = 0) -> list[TaskSchema]:
+    async def get_tasks_by_team(
+        self, team_id: int, limit: int = 0, offset: int = 0, cursor: int | None = None
+    ) -> list[TaskSchema]:
         """
         Retrieve all tasks for a given team.
 
@@ -86,15 +88,16 @@ class TaskService:
             team_id (int): ID of the team.
             limit (int, optional): Maximum number of tasks to retrieve. Defaults to 0 (no limit).
             offset (int, optional): Number of tasks to skip before returning results. Defaults to 0.
+            cursor (int | None, optional): ID of the last task of the previous page. Defaults to None.
 
         Returns:
             list[TaskSchema]: List of TaskSchema objects including evaluation if it exists.
         """
-        tasks = await self.manager.get_tasks_by_team(team_id, limit, offset)
-        return [TaskSchema.model_validate(task) for task in tasks]
+        tasks = self.manager.iter_tasks_by_team(team_id, limit, offset, cursor)
+        return [TaskSchema.model_validate(task) async for task in tasks]
 
     async def get_tasks_by_performer(
-        self, performer_id: int, team_id: int, limit: int = 0, offset: int = 0
+        self, performer_id: int, team_id: int, limit: int = 0, offset: int = 0, cursor: int | None = None
     ) -> list[TaskSchema]:
         """
         Retrieve tasks assigned to a specific performer within a team.
@@ -104,12 +107,13 @@ class TaskService:
             team_id (int): ID of the team.
             limit (int, optional): Maximum number of tasks to retrieve. Defaults to 0 (no limit).
             offset (int, optional): Number of tasks to skip before returning results. Defaults to 0.
+            cursor (int | None, optional): ID of the last task of the previous page. Defaults to None.
 
         Returns:
             list[TaskSchema]: List of TaskSchema objects including evaluation if it exists.
         """
-        tasks = await self.manager.get_tasks_by_performer(performer_id, team_id, limit, offset)
-        return [TaskSchema.model_validate(task) for task in tasks]
+        tasks = self.manager.iter_tasks_by_performer(performer_id, team_id, limit, offset, cursor)
+        return [TaskSchema.model_validate(task) async for task in tasks]
 
     async def update_task(self, task_data: TaskUpdateSchema, task_id: int, team_id: int) -> TaskUpdateSuccessSchema:
         """
@@ -127,12 +131,7 @@ class TaskService:
             HTTPException: If the task is not found, access is denied, or an error occurs.
         """
         try:
-            task = await self.manager.update_task(task_data, task_id, team_id)
-            if not task:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail='The task was not found',
-                )
+            await self.manager.update_task(task_data, task_id, team_id)
         except LookupError as e:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -224,7 +223,7 @@ class TaskService:
         return EvaluationSuccessSchema()
 
 
-def get_task_service(manager: Annotated[TaskManager, Depends(get_task_manager)]) -> TaskService:
+async def get_task_service(manager: Annotated[TaskManager, Depends(get_task_manager)]) -> TaskService:
     """
     Dependency injector for TaskService.
 
@@ -150,17 +150,24 @@ class TeamService:
             )
         return UserTeamCreateSuccessSchema()
 
-    async def remove_user_from_team(self, user_id: int, team_id: int) -> None:
+    async def remove_user_from_team(self, user_id: int, team_id: int, requester_id: int | None = None) -> None:
         """
         Remove a user from a team.
 
         Args:
             user_id (int): ID of the user to remove.
             team_id (int): ID of the team.
+            requester_id (int | None, optional): ID of the user performing the removal. Defaults to None.
 
         Raises:
-            HTTPException: If the user is not a member of the team.
+            HTTPException: If the requester tries to remove themselves or the user is not a member of the team.
         """
+        if user_id == requester_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail='You cannot remove yourself from the team',
+            )
+
         deleted = await self.manager.delete_user_team_association(user_id, team_id)
         if not deleted:
             raise HTTPException(
@@ -182,7 +189,7 @@ class TeamService:
         return await self.manager.get_avg_evaluation(user_id, team_id)
 
 
-def get_team_service(manager: Annotated[TeamManager, Depends(get_team_manager)]) -> TeamService:
+async def get_team_service(manager: Annotated[TeamManager, Depends(get_team_manager)]) -> TeamService:
     """
     Dependency injector for TeamService.
 
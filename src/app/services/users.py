@@ -80,7 +80,7 @@ class UserService:
         await self.manager.delete_user(user)
 
 
-def get_user_service(manager: Annotated[UserManager, Depends(get_user_manager)]) -> UserService:
+async def get_user_service(manager: Annotated[UserManager, Depends(get_user_manager)]) -> UserService:
     """
     Dependency injector for UserService.
 
@@ -0,0 +1,121 @@
+from contextlib import asynccontextmanager
+
+import pytest
+from fastapi import FastAPI
+from fastapi.templating import Jinja2Templates
+from httpx import ASGITransport, AsyncClient
+from jinja2 import DictLoader, Environment
+from starlette.requests import Request
+
+from app.front import render as front_render
+from app.front import utils as front_utils
+from app.front.utils import FrontContext, FrontContextMiddleware
+from app.models.users import User
+
+
+def make_request(host: str) -> Request:
+    return Request(
+        {
+            'type': 'http',
+            'method': 'GET',
+            'scheme': 'http',
+            'server': (host, 80),
+            'path': '/login',
+            'root_path': '',
+            'query_string': b'',
+            'headers': [(b'host', host.encode())],
+        }
+    )
+
+
+@pytest.fixture
+def page_env(monkeypatch: pytest.MonkeyPatch) -> Environment:
+    env = Environment(loader=DictLoader({'page.html': '{{ request.base_url }}|{{ context.is_auth }}'}))
+    monkeypatch.setattr(front_render, 'env', env)
+    monkeypatch.setattr(front_render, 'templates', Jinja2Templates(env=env))
+    monkeypatch.setattr(front_render, 'static_pages_cache', {})
+    return env
+
+
+class TestRenderStaticPage:
+    def test_anonymous_page_is_cached(self, page_env: Environment):
+        request = make_request('test')
+
+        response = front_render.render_static_page('page.html', request, FrontContext())
+        assert response.body == b'http://test/|False'
+
+        page_env.loader.mapping['page.html'] = 'changed'
+        page_env.cache.clear()
+        response = front_render.render_static_page('page.html', request, FrontContext())
+        assert response.body == b'http://test/|False'
+
+        response = front_render.render_static_page('page.html', make_request('other'), FrontContext())
+        assert response.body == b'changed'
+
+    def test_authenticated_page_bypasses_cache(self, page_env: Environment):
+        request = make_request('test')
+        front_render.render_static_page('page.html', request, FrontContext())
+
+        context = FrontContext(is_auth=True, user=User(username='testuser'))
+        response = front_render.render_static_page('page.html', request, context)
+        assert response.body == b'http://test/|True'
+        assert len(front_render.static_pages_cache) == 1
+
+
+@pytest.fixture
+def resolved_tokens(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    tokens = []
+
+    @asynccontextmanager
+    async def session_factory():
+        tokens.append('session')
+        yield None
+
+    async def get_request_user(request, session, credentials=None):
+        tokens.append(credentials.credentials if credentials else request.cookies['access_token'])
+        return User(username='testuser')
+
+    monkeypatch.setattr(front_utils, 'session_factory', session_factory)
+    monkeypatch.setattr(front_utils, 'get_request_user', get_request_user)
+    return tokens
+
+
+@pytest.fixture
+def front_app() -> FastAPI:
+    new_app = FastAPI()
+    new_app.add_middleware(FrontContextMiddleware)
+
+    @new_app.get('/{path:path}')
+    async def page(request: Request):
+        context = getattr(request.state, 'context', None)
+        return {'is_auth': None if context is None else context.is_auth}
+
+    return new_app
+
+
+@pytest.mark.asyncio
+class TestFrontContextMiddleware:
+    async def test_non_front_paths_pass_through(self, front_app: FastAPI, resolved_tokens: list[str]):
+        async with AsyncClient(transport=ASGITransport(app=front_app), base_url='http://test') as ac:
+            for path in ('/api/users', '/admin', '/static/style.css'):
+                response = await ac.get(path, headers={'Authorization': 'Bearer token'})
+                assert response.json() == {'is_auth': None}
+
+        assert resolved_tokens == []
+
+    async def test_anonymous_request_opens_no_session(self, front_app: FastAPI, resolved_tokens: list[str]):
+        async with AsyncClient(transport=ASGITransport(app=front_app), base_url='http://test') as ac:
+            response = await ac.get('/login')
+
+        assert response.json() == {'is_auth': False}
+        assert resolved_tokens == []
+
+    async def test_bearer_and_cookie_resolve_user(self, front_app: FastAPI, resolved_tokens: list[str]):
+        async with AsyncClient(transport=ASGITransport(app=front_app), base_url='http://test') as ac:
+            response = await ac.get('/teams', headers={'Authorization': 'Bearer header-token'})
+            assert response.json() == {'is_auth': True}
+
+            response = await ac.get('/teams', cookies={'access_token': 'cookie-token'})
+            assert response.json() == {'is_auth': True}
+
+        assert resolved_tokens == ['session', 'header-token', 'session', 'cookie-token']
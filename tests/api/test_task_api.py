@@ -71,6 +71,19 @@ class TestTasksAPI:
         assert response.status_code == status.HTTP_201_CREATED
         assert 'task_id' in response.json()
 
+    async def test_create_task_with_past_deadline(self, app: FastAPI, session: AsyncSession, user_data):
+        admin_user, token = await self._create_user_and_token(session, user_data)
+        team = await self._create_team(session, admin_user)
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url='http://test') as ac:
+            response = await ac.post(
+                f'/api/teams/{team.id}/tasks/',
+                json={'description': 'Test Task', 'deadline': str(date.today() - timedelta(days=1))},
+                headers={'Authorization': f'Bearer {token}'},
+            )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
     async def test_get_tasks_by_team(self, app: FastAPI, session: AsyncSession, user_data):
         admin_user, token = await self._create_user_and_token(session, user_data)
         team = await self._create_team(session, admin_user)
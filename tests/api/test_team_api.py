@@ -97,14 +97,23 @@ class TestTeamsAPI:
         team_manager = TeamManager(session)
         team = await team_manager.create_team(TeamCreateSchema(name='Team 1'), manager_user)
         await team_manager.assign_role(manager_user.id, team.id, UserRoles.ADMIN)
+        member, _ = await self._create_user_and_token(
+            session, user_data.model_copy(update={'username': 'member', 'email': 'member@email.com'})
+        )
+        await team_manager.assign_role(member.id, team.id, UserRoles.USER)
 
         async with AsyncClient(transport=ASGITransport(app=app), base_url='http://test') as ac:
             response = await ac.delete(
-                f'/api/teams/{team.id}/users/{manager_user.id}',
+                f'/api/teams/{team.id}/users/{member.id}',
                 headers={'Authorization': f'Bearer {manager_token}'},
             )
+            assert response.status_code == status.HTTP_204_NO_CONTENT
 
-        assert response.status_code == status.HTTP_204_NO_CONTENT
+            response = await ac.delete(
+                f'/api/teams/{team.id}/users/{manager_user.id}',
+                headers={'Authorization': f'Bearer {manager_token}'},
+            )
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
 
     async def test_get_avg_evaluation(self, app: FastAPI, session: AsyncSession, user_data):
         user, token = await self._create_user_and_token(session, user_data)
@@ -3,6 +3,7 @@ from typing import AsyncGenerator
 import pytest_asyncio
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 
 from app.core.config import config
 from app.core.redis import redis
@@ -11,7 +12,7 @@ from app.models.base import Base
 
 @pytest_asyncio.fixture
 async def engine() -> AsyncGenerator[AsyncEngine, None]:
-    engine = create_async_engine(config.DB_URL)
+    engine = create_async_engine(config.DB_URL, poolclass=NullPool)
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield engine
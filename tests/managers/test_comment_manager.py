@@ -22,18 +22,17 @@ from app.schemas.users import UserCreateSchema
 @pytest_asyncio.fixture
 async def users(session: AsyncSession) -> list[User]:
     user_manager = UserManager(session)
-    users = []
-    for i in range(3):
-        user_data = UserCreateSchema(
+    users_data = [
+        UserCreateSchema(
             username=f'username{i}',
             email=f'email{i}@email.com',
             password=f'password{i}',
             first_name=f'first_name{i}',
             last_name=f'last_name{i}',
         )
-        new_user = await user_manager.create_user(user_data)
-        users.append(new_user)
-    return users
+        for i in range(3)
+    ]
+    return await user_manager.create_users(users_data)
 
 
 @pytest_asyncio.fixture
@@ -91,6 +90,26 @@ class TestCommentManager:
         comment_in_task_count = result.scalar_one()
         assert comment_in_task_count == 2
 
+    async def test_create_comments(
+        self,
+        session: AsyncSession,
+        task: Task,
+        users: list[User],
+        team: Team,
+    ):
+        manager = CommentManager(session)
+        comments_data = [CommentCreateSchema(text=f'comment{i}') for i in range(3)]
+
+        new_comments = await manager.create_comments(comments_data, users[1].id, task.id, team.id)
+
+        assert [comment.text for comment in new_comments] == ['comment0', 'comment1', 'comment2']
+        assert all(comment.task_id == task.id for comment in new_comments)
+        assert all(comment.user_id == users[1].id for comment in new_comments)
+
+        stmt = select(func.count()).select_from(Comment).where(Comment.task_id == task.id)
+        result = await session.execute(stmt)
+        assert result.scalar_one() == 3
+
     async def test_get_comments_by_task(
         self,
         session: AsyncSession,
@@ -112,6 +131,45 @@ class TestCommentManager:
         assert task_comments[1].task_id == task.id
         assert task_comments[2].task_id == task.id
 
+    async def test_get_comments_by_task_with_cursor(
+        self,
+        session: AsyncSession,
+        comment_data: CommentCreateSchema,
+        task: Task,
+        users: list[User],
+        team: Team,
+    ):
+        manager = CommentManager(session)
+        new_comment_1 = await manager.create_comment(comment_data, users[1].id, task.id, team.id)
+        new_comment_2 = await manager.create_comment(comment_data, users[1].id, task.id, team.id)
+        new_comment_3 = await manager.create_comment(comment_data, users[2].id, task.id, team.id)
+
+        first_page = await manager.get_comments_by_task(task.id, team.id, limit=2)
+        assert [comment.id for comment in first_page] == [new_comment_1.id, new_comment_2.id]
+
+        second_page = await manager.get_comments_by_task(task.id, team.id, limit=2, cursor=first_page[-1].id)
+        assert [comment.id for comment in second_page] == [new_comment_3.id]
+
+    async def test_iter_comments_by_task(
+        self,
+        session: AsyncSession,
+        comment_data: CommentCreateSchema,
+        task: Task,
+        users: list[User],
+        team: Team,
+    ):
+        manager = CommentManager(session)
+        new_comment_1 = await manager.create_comment(comment_data, users[1].id, task.id, team.id)
+        new_comment_2 = await manager.create_comment(comment_data, users[2].id, task.id, team.id)
+
+        task_comments = [comment async for comment in manager.iter_comments_by_task(task.id, team.id)]
+
+        assert [comment.id for comment in task_comments] == [new_comment_1.id, new_comment_2.id]
+
+        with pytest.raises(LookupError):
+            async for _ in manager.iter_comments_by_task(999, team.id):
+                pass
+
     async def test_delete_comment(
         self,
         session: AsyncSession,
@@ -8,10 +8,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.managers.meetings import MeetingManager
 from app.managers.teams import TeamManager
 from app.managers.users import UserManager
-from app.models.meetings import Meeting
+from app.models.meetings import Meeting, user_meeting_association
 from app.models.teams import Team, UserRoles
 from app.models.users import User
-from app.schemas.meetings import MeetingCreateSchema, MeetingUpdateSchema
+from app.schemas.meetings import MeetingCreateSchema, MeetingSchema, MeetingUpdateSchema
 from app.schemas.teams import TeamCreateSchema
 from app.schemas.users import UserCreateSchema
 
@@ -19,18 +19,17 @@ from app.schemas.users import UserCreateSchema
 @pytest_asyncio.fixture
 async def users(session: AsyncSession) -> list[User]:
     user_manager = UserManager(session)
-    users = []
-    for i in range(3):
-        user_data = UserCreateSchema(
+    users_data = [
+        UserCreateSchema(
             username=f'username{i}',
             email=f'email{i}@email.com',
             password=f'password{i}',
             first_name=f'first_name{i}',
             last_name=f'last_name{i}',
         )
-        new_user = await user_manager.create_user(user_data)
-        users.append(new_user)
-    return users
+        for i in range(3)
+    ]
+    return await user_manager.create_users(users_data)
 
 
 @pytest_asyncio.fixture
@@ -75,7 +74,17 @@ class TestMeetingManager:
         meeting_data_2.member_ids = [users[1].id, users[2].id]
         new_meeting_2 = await manager.create_meeting(meeting_data_2, team.id)
         assert new_meeting_2.date == meeting_data_2.date
-        assert len(new_meeting_2.users) == 2
+
+        meeting_schema = MeetingSchema.model_validate(new_meeting_2)
+        assert sorted(user.id for user in meeting_schema.users) == [users[1].id, users[2].id]
+
+        stmt = (
+            select(func.count())
+            .select_from(user_meeting_association)
+            .where(user_meeting_association.c.meeting_id == new_meeting_2.id)
+        )
+        result = await session.execute(stmt)
+        assert result.scalar_one() == 2
 
         stmt = select(func.count()).select_from(Meeting).where(Meeting.team_id == team.id)
         result = await session.execute(stmt)
@@ -98,6 +107,21 @@ class TestMeetingManager:
         assert meetings[0].team_id == team.id
         assert meetings[1].team_id == team.id
 
+    async def test_get_meetings_by_team_with_cursor(
+        self, session: AsyncSession, meeting_data: MeetingCreateSchema, users: list[User], team: Team
+    ):
+        manager = MeetingManager(session)
+        new_meeting_1 = await manager.create_meeting(meeting_data, team.id)
+        meeting_data_2 = meeting_data.model_copy()
+        meeting_data_2.date = meeting_data.date - datetime.timedelta(days=1)
+        new_meeting_2 = await manager.create_meeting(meeting_data_2, team.id)
+
+        first_page = await manager.get_meetings_by_team(team.id, limit=1)
+        assert [meeting.id for meeting in first_page] == [new_meeting_1.id]
+
+        second_page = await manager.get_meetings_by_team(team.id, limit=1, cursor=first_page[-1].id)
+        assert [meeting.id for meeting in second_page] == [new_meeting_2.id]
+
     async def test_get_meetings_by_member(
         self, session: AsyncSession, meeting_data: MeetingCreateSchema, users: list[User], team: Team
     ):
@@ -140,6 +164,79 @@ class TestMeetingManager:
         assert updated_meeting.time == meeting_data_for_update.time
         assert len(updated_meeting.users) == 2
 
+    async def test_update_meeting_members(
+        self, session: AsyncSession, meeting_data: MeetingCreateSchema, users: list[User], team: Team
+    ):
+        manager = MeetingManager(session)
+        new_meeting = await manager.create_meeting(meeting_data, team.id)
+
+        meeting_data_for_update = MeetingUpdateSchema(member_ids=[users[0].id, users[1].id])
+        updated_meeting = await manager.update_meeting(meeting_data_for_update, new_meeting.id, team.id)
+        assert sorted(user.id for user in updated_meeting.users) == [users[0].id, users[1].id]
+
+        meeting_data_for_update = MeetingUpdateSchema(member_ids=[users[2].id])
+        updated_meeting = await manager.update_meeting(meeting_data_for_update, new_meeting.id, team.id)
+        assert [user.id for user in updated_meeting.users] == [users[2].id]
+
+        stmt = select(func.count()).select_from(user_meeting_association)
+        result = await session.execute(stmt)
+        assert result.scalar_one() == 1
+
+    async def test_update_meeting_with_member_outside_team(
+        self, session: AsyncSession, meeting_data: MeetingCreateSchema, users: list[User], team: Team
+    ):
+        manager = MeetingManager(session)
+        new_meeting = await manager.create_meeting(meeting_data, team.id)
+        outsider = await UserManager(session).create_user(
+            UserCreateSchema(
+                username='outsider',
+                email='outsider@email.com',
+                password='password',
+                first_name='first_name',
+                last_name='last_name',
+            )
+        )
+
+        with pytest.raises(LookupError):
+            await manager.update_meeting(MeetingUpdateSchema(member_ids=[outsider.id]), new_meeting.id, team.id)
+
+        meetings = await manager.get_meetings_by_member(users[0].id, team.id)
+        assert [meeting.id for meeting in meetings] == [new_meeting.id]
+
+    async def test_update_meeting_slot_collision(
+        self, session: AsyncSession, meeting_data: MeetingCreateSchema, users: list[User], team: Team
+    ):
+        manager = MeetingManager(session)
+        await manager.create_meeting(meeting_data, team.id)
+        meeting_data_2 = meeting_data.model_copy()
+        meeting_data_2.date = meeting_data.date - datetime.timedelta(days=1)
+        new_meeting_2 = await manager.create_meeting(meeting_data_2, team.id)
+
+        with pytest.raises(ValueError):
+            await manager.update_meeting(MeetingUpdateSchema(date=meeting_data.date), new_meeting_2.id, team.id)
+
+        with pytest.raises(ValueError):
+            await manager.update_meeting(
+                MeetingUpdateSchema(date=meeting_data.date, member_ids=[users[1].id]), new_meeting_2.id, team.id
+            )
+
+        meetings = await manager.get_meetings_by_team(team.id)
+        assert sorted(meeting.date for meeting in meetings) == [meeting_data_2.date, meeting_data.date]
+
+    async def test_update_past_meeting(
+        self, session: AsyncSession, meeting_data: MeetingCreateSchema, users: list[User], team: Team
+    ):
+        manager = MeetingManager(session)
+        new_meeting = await manager.create_meeting(meeting_data, team.id)
+        new_meeting.date = datetime.date.today() - datetime.timedelta(days=1)
+        await session.flush()
+
+        with pytest.raises(ValueError):
+            await manager.update_meeting(MeetingUpdateSchema(name='meeting_name2'), new_meeting.id, team.id)
+
+        with pytest.raises(LookupError):
+            await manager.update_meeting(MeetingUpdateSchema(name='meeting_name2'), new_meeting.id + 100, team.id)
+
     async def test_delete_meeting(
         self, session: AsyncSession, meeting_data: MeetingCreateSchema, users: list[User], team: Team
     ):
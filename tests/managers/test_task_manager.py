@@ -21,18 +21,17 @@ from app.schemas.users import UserCreateSchema
 @pytest_asyncio.fixture
 async def users(session: AsyncSession) -> list[User]:
     user_manager = UserManager(session)
-    users = []
-    for i in range(3):
-        user_data = UserCreateSchema(
+    users_data = [
+        UserCreateSchema(
             username=f'username{i}',
             email=f'email{i}@email.com',
             password=f'password{i}',
             first_name=f'first_name{i}',
             last_name=f'last_name{i}',
         )
-        new_user = await user_manager.create_user(user_data)
-        users.append(new_user)
-    return users
+        for i in range(3)
+    ]
+    return await user_manager.create_users(users_data)
 
 
 @pytest_asyncio.fixture
@@ -80,6 +79,31 @@ class TestTaskManager:
         task_in_team_count = result.scalar_one()
         assert task_in_team_count == 2
 
+    async def test_create_tasks_bulk(
+        self, session: AsyncSession, task_data: TaskCreateSchema, users: list[User], team: Team
+    ):
+        manager = TaskManager(session)
+        tasks_data = []
+        for i in range(3):
+            new_task_data = task_data.model_copy()
+            new_task_data.description = f'description{i}'
+            new_task_data.performer_id = users[i].id
+            tasks_data.append(new_task_data)
+
+        new_tasks = await manager.create_tasks_bulk(tasks_data, team.id)
+
+        assert [task.description for task in new_tasks] == ['description0', 'description1', 'description2']
+        assert [task.performer_id for task in new_tasks] == [user.id for user in users]
+        assert all(task.team_id == team.id for task in new_tasks)
+
+        stmt = select(func.count()).select_from(Task).where(Task.team_id == team.id)
+        result = await session.execute(stmt)
+        assert result.scalar_one() == 3
+
+        task_data.performer_id = users[2].id + 1000
+        with pytest.raises(LookupError):
+            await manager.create_tasks_bulk([task_data], team.id)
+
     async def test_get_tasks_by_team(
         self, session: AsyncSession, task_data: TaskCreateSchema, users: list[User], team: Team
     ):
@@ -98,6 +122,35 @@ class TestTaskManager:
         assert tasks[0].team_id == team.id
         assert tasks[1].team_id == team.id
 
+    async def test_get_tasks_by_team_with_cursor(
+        self, session: AsyncSession, task_data: TaskCreateSchema, users: list[User], team: Team
+    ):
+        manager = TaskManager(session)
+        task_data.performer_id = users[1].id
+        new_task_1 = await manager.create_task(task_data, team.id)
+        new_task_2 = await manager.create_task(task_data, team.id)
+
+        first_page = await manager.get_tasks_by_team(team.id, limit=1)
+        assert [task.id for task in first_page] == [new_task_1.id]
+
+        second_page = await manager.get_tasks_by_team(team.id, limit=1, cursor=first_page[-1].id)
+        assert [task.id for task in second_page] == [new_task_2.id]
+
+    async def test_iter_tasks_by_team(
+        self, session: AsyncSession, task_data: TaskCreateSchema, users: list[User], team: Team
+    ):
+        manager = TaskManager(session)
+        task_data.performer_id = users[1].id
+        new_task_1 = await manager.create_task(task_data, team.id)
+        new_task_2 = await manager.create_task(task_data, team.id)
+        await manager.update_task_evaluation(new_task_1.id, team.id, users[0].id, EvaluationSchema(value=4))
+
+        rows = [row async for row in manager.iter_tasks_by_team(team.id)]
+
+        assert [row.id for row in rows] == [new_task_1.id, new_task_2.id]
+        assert [row.evaluation for row in rows] == [4, None]
+        assert not isinstance(rows[0], Task)
+
     async def test_get_tasks_by_performer(
         self, session: AsyncSession, task_data: TaskCreateSchema, users: list[User], team: Team
     ):
@@ -18,18 +18,17 @@ from app.schemas.users import UserCreateSchema
 @pytest_asyncio.fixture
 async def users(session: AsyncSession) -> list[User]:
     user_manager = UserManager(session)
-    users = []
-    for i in range(3):
-        user_data = UserCreateSchema(
+    users_data = [
+        UserCreateSchema(
             username=f'username{i}',
             email=f'email{i}@email.com',
             password=f'password{i}',
             first_name=f'first_name{i}',
             last_name=f'last_name{i}',
         )
-        new_user = await user_manager.create_user(user_data)
-        users.append(new_user)
-    return users
+        for i in range(3)
+    ]
+    return await user_manager.create_users(users_data)
 
 
 @pytest.fixture
@@ -79,6 +78,22 @@ class TestTeamManager:
         user_in_team_count = result.scalar_one()
         assert user_in_team_count == 3
 
+    async def test_assign_role_updates_existing_member(
+        self, session: AsyncSession, team_data: TeamCreateSchema, users: list[User]
+    ):
+        manager = TeamManager(session)
+        new_team = await manager.create_team(team_data, users[0])
+        association = await manager.assign_role(users[1].id, new_team.id, UserRoles.USER)
+
+        updated_association = await manager.assign_role(users[1].id, new_team.id, UserRoles.MANAGER)
+
+        assert updated_association.id == association.id
+        assert updated_association.role == UserRoles.MANAGER
+
+        stmt = select(UserTeam.role).where(UserTeam.user_id == users[1].id, UserTeam.team_id == new_team.id)
+        result = await session.execute(stmt)
+        assert result.scalars().all() == [UserRoles.MANAGER]
+
     async def test_get_users(self, session: AsyncSession, team_data: TeamCreateSchema, users: list[User]):
         manager = TeamManager(session)
         new_team = await manager.create_team(team_data, users[0])
@@ -133,6 +148,24 @@ class TestTeamManager:
         deleted_team = result.scalar_one_or_none()
         assert deleted_team is None
 
+    async def test_delete_user_team_association_keeps_team(
+        self, session: AsyncSession, team_data: TeamCreateSchema, users: list[User]
+    ):
+        manager = TeamManager(session)
+        new_team = await manager.create_team(team_data, users[0])
+        await manager.assign_role(users[1].id, new_team.id, UserRoles.USER)
+
+        assert await manager.delete_user_team_association(users[1].id, new_team.id)
+        assert not await manager.delete_user_team_association(users[1].id, new_team.id)
+        assert not await manager.delete_user_team_association(users[2].id, new_team.id)
+
+        users_and_roles = await manager.get_users(new_team.id)
+        assert [(user.id, role) for user, role in users_and_roles] == [(users[0].id, UserRoles.ADMIN)]
+
+        stmt = select(Team).where(Team.id == new_team.id)
+        result = await session.execute(stmt)
+        assert result.scalar_one_or_none() is not None
+
     async def test_get_avg_evaluation(self, session: AsyncSession, team_data: TeamCreateSchema, users: list[User]):
         manager = TeamManager(session)
         new_team = await manager.create_team(team_data, users[0])
@@ -1,10 +1,19 @@
+import time
+
 import pytest
 from sqlalchemy import func, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.managers.users import UserManager
+from app.core.security import password_hasher
+from app.managers.users import (
+    DUMMY_PASSWORD_HASH,
+    UserManager,
+    remember_verified_credentials,
+    verified_credentials,
+)
 from app.models.users import User
+from app.schemas.auth import CredentialsSchema
 from app.schemas.users import UserCreateSchema, UserUpdateSchema
 
 
@@ -39,6 +48,10 @@ class TestUserManager:
 
         with pytest.raises(IntegrityError):
             await manager.create_user(user_data)
+        with pytest.raises(IntegrityError):
+            await manager.create_user(
+                user_data.model_copy(update={'username': 'username2', 'email': 'EMAIL1@email.com'})
+            )
 
         stmt = select(func.count()).select_from(User)
         result = await session.execute(stmt)
@@ -46,6 +59,65 @@ class TestUserManager:
 
         assert new_user_count - old_user_count == 1
 
+    async def test_create_users(self, session: AsyncSession, user_data: UserCreateSchema):
+        manager = UserManager(session)
+        users_data = [
+            user_data.model_copy(update={'username': f'username{i}', 'email': f'email{i}@email.com'}) for i in range(3)
+        ]
+
+        new_users = await manager.create_users(users_data)
+
+        assert [user.username for user in new_users] == ['username0', 'username1', 'username2']
+        assert all(user.hashed_password != user_data.password for user in new_users)
+        assert await manager.check_user_by_credentials(
+            CredentialsSchema(email='email1@email.com', password=user_data.password)
+        )
+
+        stmt = select(func.count()).select_from(User)
+        result = await session.execute(stmt)
+        assert result.scalar_one() == 3
+
+        with pytest.raises(IntegrityError):
+            await manager.create_users(users_data[:1])
+
+    async def test_check_user_by_credentials(self, session: AsyncSession, user_data: UserCreateSchema):
+        manager = UserManager(session)
+        new_user = await manager.create_user(user_data)
+
+        assert await manager.check_user_by_credentials(
+            CredentialsSchema(email=user_data.email, password=user_data.password)
+        )
+        assert not await manager.check_user_by_credentials(
+            CredentialsSchema(email=user_data.email, password='wrong_password')
+        )
+        assert not await manager.check_user_by_credentials(
+            CredentialsSchema(email='unknown@email.com', password=user_data.password)
+        )
+
+        await manager.update_user(new_user, UserUpdateSchema(password='password2'))
+        assert not await manager.check_user_by_credentials(
+            CredentialsSchema(email=user_data.email, password=user_data.password)
+        )
+        assert await manager.check_user_by_credentials(CredentialsSchema(email=user_data.email, password='password2'))
+
+    async def test_dummy_password_hash_matches_hasher(self):
+        assert not password_hasher.check_needs_rehash(DUMMY_PASSWORD_HASH)
+        assert UserManager.verify_password('dummy-password', DUMMY_PASSWORD_HASH)
+
+    async def test_remember_verified_credentials(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr('app.managers.users.VERIFIED_CREDENTIALS_MAX_SIZE', 2)
+        verified_credentials.clear()
+        verified_credentials[b'expired'] = time.monotonic() - 1
+        verified_credentials[b'first'] = time.monotonic() + 10
+
+        remember_verified_credentials(b'second')
+        assert list(verified_credentials) == [b'first', b'second']
+
+        remember_verified_credentials(b'first')
+        remember_verified_credentials(b'third')
+        assert list(verified_credentials) == [b'first', b'third']
+        verified_credentials.clear()
+
     async def test_update_user(self, session: AsyncSession, user_data: UserCreateSchema) -> User:
         manager = UserManager(session)
         user_update_data = UserUpdateSchema(
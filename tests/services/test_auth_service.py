@@ -50,6 +50,16 @@ class TestAuthService:
         payload = service.validate_token(response.access_token)
         assert service.get_email_from_payload(payload) == credentials.email
 
+    async def test_authenticate_with_uppercase_domain(
+        self, session: AsyncSession, credentials: CredentialsSchema, user: User
+    ):
+        manager = UserManager(session)
+        service = AuthService(manager)
+
+        response = await service.authenticate(CredentialsSchema(email='email1@EMAIL.COM', password='password1'))
+
+        assert isinstance(response, TokenSchema)
+
     async def test_authenticate_with_wrong_email(
         self, session: AsyncSession, credentials: CredentialsSchema, user: User
     ):
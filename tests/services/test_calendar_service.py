@@ -93,3 +93,21 @@ class TestCalendarService:
 
         assert len(meeting_events) == 1
         assert meeting_events[0].id == meeting.id
+
+    async def test_get_calendar_by_date_and_month(
+        self, session: AsyncSession, team: Team, task: Task, meeting: Meeting
+    ):
+        service = CalendarService(TaskManager(session), MeetingManager(session))
+
+        day = datetime.date.today() + datetime.timedelta(days=5)
+        calendar_day, calendar_month = await service.get_calendar_by_date_and_month(team.id, day)
+
+        assert calendar_day.date == day
+        assert {e.id for e in calendar_day.events} == {task.id, meeting.id}
+
+        assert calendar_month.year == day.year
+        assert calendar_month.month == day.month
+        assert len(calendar_month.events) == 2
+
+        other_day, _ = await service.get_calendar_by_date_and_month(team.id, day + datetime.timedelta(days=1))
+        assert other_day.events == []
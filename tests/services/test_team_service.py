@@ -138,6 +138,20 @@ class TestTeamService:
         assoc = result.scalar_one_or_none()
         assert assoc is None
 
+    async def test_remove_user_from_team_self(self, session: AsyncSession, user: User, team_data: TeamCreateSchema):
+        manager = TeamManager(session)
+        service = TeamService(manager)
+
+        team = await manager.create_team(team_data, user)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await service.remove_user_from_team(user.id, team.id, requester_id=user.id)
+        assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+
+        stmt = select(UserTeam).where(UserTeam.user_id == user.id, UserTeam.team_id == team.id)
+        result = await session.execute(stmt)
+        assert result.scalar_one_or_none() is not None
+
     async def test_remove_user_from_team_not_found(self, session: AsyncSession):
         manager = TeamManager(session)
         service = TeamService(manager)